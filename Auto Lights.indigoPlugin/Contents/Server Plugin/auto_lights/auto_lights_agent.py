@@ -1,11 +1,11 @@
 import datetime
-import threading
 from typing import List
 
 from . import utils
 from .auto_lights_base import AutoLightsBase
 from .auto_lights_config import AutoLightsConfig
-from .zone import Zone, LOCK_HOLD_GRACE_SECONDS
+from .scheduler import get_scheduler, shutdown_scheduler
+from .zone import Zone, LOCK_HOLD_GRACE_SECONDS, shutdown_write_executor
 
 try:
     import indigo
@@ -37,24 +37,37 @@ class AutoLightsAgent(AutoLightsBase):
         # GUARD: skip if already running
         if zone.checked_out:
             self._debug_log(
-                f"Skipping process_zone for '{zone.name}' – still checked out"
+                "Skipping process_zone for '%s' – still checked out", zone.name
             )
             return False
 
+        # pin "now" and a device snapshot for this thread only (see
+        # AutoLightsBase._now and Zone._devices); a nested call leaves the
+        # outer evaluation's pins in place
+        pinned = zone.begin_evaluation()
+        try:
+            return self._process_zone(zone)
+        finally:
+            if pinned:
+                zone.end_evaluation()
+
+    def _process_zone(self, zone: Zone) -> bool:
         # GUARD: plugin globally disabled
         if not self.config.enabled:
             config_dev_name = self.config.indigo_dev.name if self.config.indigo_dev else "Unknown"
             config_dev_state = self.config.indigo_dev.onState if self.config.indigo_dev else False
             self._debug_log(
-                f"Skipping process_zone: plugin globally DISABLED "
-                f"(config device '{config_dev_name}' onState={config_dev_state})"
+                "Skipping process_zone: plugin globally DISABLED "
+                "(config device '%s' onState=%s)",
+                config_dev_name,
+                config_dev_state,
             )
             return False
 
         # GUARD: zone disabled
-        self._debug_log(f"process_zone: zone.enabled={zone.enabled}")
+        self._debug_log("process_zone: zone.enabled=%s", zone.enabled)
         if not zone.enabled:
-            self._debug_log(f"Skipping process_zone for '{zone.name}' – zone disabled")
+            self._debug_log("Skipping process_zone for '%s' – zone disabled", zone.name)
             return False
 
         # Initialize baseline if needed
@@ -74,7 +87,7 @@ class AutoLightsAgent(AutoLightsBase):
         # LOCK: skip if already locked
         if zone.lock_enabled and zone.locked:
             self._debug_log(
-                f"Zone '{zone.name}' is locked until {zone.lock_expiration}"
+                "Zone '%s' is locked until %s", zone.name, zone.lock_expiration
             )
             zone.check_in()
             return False
@@ -124,7 +137,7 @@ class AutoLightsAgent(AutoLightsBase):
                 self.logger.info(f"\t\t{emoji} {msg}")
             zone.save_brightness_changes()
         else:
-            self._debug_log(f"Zone '{zone.name}': no changes to make")
+            self._debug_log("Zone '%s': no changes to make", zone.name)
             zone.check_in()
 
         # sync the indigo device for any runtime changes
@@ -164,11 +177,7 @@ class AutoLightsAgent(AutoLightsBase):
                 # cleared on those, suppression would never engage and the
                 # writer-thread re-eval loop would flood the network.
                 if zone._device_fail_count.get(current_dev.id, 0) > 0:
-                    target_map = {
-                        t["dev_id"]: t["brightness"]
-                        for t in (zone.target_brightness or [])
-                    }
-                    desired = target_map.get(current_dev.id)
+                    desired = zone.target_brightness_map.get(current_dev.id)
                     if desired is not None and utils.is_device_at_target(
                         current_dev, desired
                     ):
@@ -189,13 +198,14 @@ class AutoLightsAgent(AutoLightsBase):
                     continue
 
                 self._debug_log(
-                    f"Change from {current_dev.name}; zone property: {device_prop}"
+                    "Change from %s; zone property: %s", current_dev.name, device_prop
                 )
 
                 # Skip lock logic when no active lighting period
                 if zone.current_lighting_period is None:
                     self._debug_log(
-                        f"Skipping lock logic for '{zone.name}': no active lighting period"
+                        "Skipping lock logic for '%s': no active lighting period",
+                        zone.name,
                     )
                     continue
 
@@ -245,12 +255,9 @@ class AutoLightsAgent(AutoLightsBase):
                         # Cancel any existing timer for this zone
                         if zone.name in self._timers:
                             self._timers[zone.name].cancel()
-                        timer = threading.Timer(
-                            delay, self.process_expired_lock, args=[zone]
+                        self._timers[zone.name] = get_scheduler().schedule(
+                            delay, self.process_expired_lock, zone
                         )
-                        timer.daemon = True
-                        self._timers[zone.name] = timer
-                        timer.start()
             elif device_prop in ["presence_dev_ids", "luminance_dev_ids"]:
                 # Invalidate the corresponding runtime cache so the next
                 # process_zone reads fresh sensor state. Without this, a
@@ -313,27 +320,32 @@ class AutoLightsAgent(AutoLightsBase):
         Process a variable change event.
 
         If the global configuration has the variable (via has_variable),
-        then process all zones. Otherwise, for each zone,
-        check if the zone has the variable and process it.
+        then process all zones. Otherwise, process each zone that has the
+        variable (via AutoLightsConfig.zones_for_variable).
 
         Returns:
             List[Zone]: List of Zone's processed.
         """
         processed = []
-        if self.config.has_variable(orig_var.id):
+        var_id = orig_var.id
+        # zones that use this variable, from the index built at config load
+        var_zones = self.config.zones_for_variable(var_id)
+        # zones cache their minimum luminance variable; drop stale values
+        # before any zone is processed, including via the global path
+        for zone in var_zones:
+            zone.invalidate_minimum_luminance()
+
+        if self.config.has_variable(var_id):
             self.logger.debug(
-                f"Global config has variable: {indigo.variables[orig_var.id].name}; running process_all_zones"
+                f"Global config has variable: {indigo.variables[var_id].name}; running process_all_zones"
             )
             self.process_all_zones()
             return self.config.zones
 
-        for zone in self.config.zones:
-            if zone.has_variable(orig_var.id):
-                self.logger.debug(
-                    f"has_variable: var_id {indigo.variables[orig_var.id].name}"
-                )
-                if self.process_zone(zone):
-                    processed.append(zone)
+        for zone in var_zones:
+            self.logger.debug(f"has_variable: var_id {indigo.variables[var_id].name}")
+            if self.process_zone(zone):
+                processed.append(zone)
         return processed
 
     def get_zones(self) -> List[Zone]:
@@ -386,11 +398,9 @@ class AutoLightsAgent(AutoLightsBase):
                 # Cancel any existing timer for this zone
                 if unlocked_zone.name in self._timers:
                     self._timers[unlocked_zone.name].cancel()
-                timer = threading.Timer(
-                    delay, self.process_expired_lock, args=[unlocked_zone]
+                self._timers[unlocked_zone.name] = get_scheduler().schedule(
+                    delay, self.process_expired_lock, unlocked_zone
                 )
-                self._timers[unlocked_zone.name] = timer
-                timer.start()
 
     def print_locked_zones(self) -> None:
         """
@@ -471,11 +481,8 @@ class AutoLightsAgent(AutoLightsBase):
                 entry["dev_id"]: entry["brightness"]
                 for entry in zone.current_lights_status(include_lock_excluded=True)
             }
-            # zone.target_brightness might be None or empty
-            target_map = {
-                entry["dev_id"]: entry["brightness"]
-                for entry in (zone.target_brightness or [])
-            }
+            # empty when the zone has no target_brightness yet
+            target_map = zone.target_brightness_map
 
             for dev_id in zone.on_lights_dev_ids + zone.off_lights_dev_ids:
                 actual = current_map.get(dev_id)
@@ -498,12 +505,16 @@ class AutoLightsAgent(AutoLightsBase):
     def shutdown(self) -> None:
         """
         Cancel all outstanding timers (lock-expiration timers in self._timers,
-        plus each zone's transition-timer and lock-timer).
+        no-presence grace timers, plus each zone's transition-timer and
+        lock-timer), and stop the shared device-write pool and timer scheduler.
         """
         # Cancel agent-level timers
         for t in self._timers.values():
             t.cancel()
         self._timers.clear()
+        for t in self._no_presence_timers.values():
+            t.cancel()
+        self._no_presence_timers.clear()
 
         # Cancel each zone's timers
         for zone in self.config.zones:
@@ -514,6 +525,9 @@ class AutoLightsAgent(AutoLightsBase):
                 zone._lock_timer.cancel()
                 zone._lock_timer = None
 
+        shutdown_write_executor()
+        shutdown_scheduler()
+
     def refresh_all_indigo_devices(self) -> None:
         """
         Refresh all Indigo device states for all zones by syncing each zone's device states.
@@ -1,5 +1,7 @@
-import inspect
+import datetime
 import logging
+import sys
+import threading
 
 
 class AutoLightsBase:
@@ -10,12 +12,37 @@ class AutoLightsBase:
 
     def __init__(self, logger_name="Plugin"):
         self.logger = logging.getLogger(logger_name)
+        # state pinned for the evaluation running on the calling thread;
+        # other threads working on the same object never see it
+        self._eval_local = threading.local()
 
-    def _debug_log(self, message: str) -> None:
-        stack = inspect.stack()
-        current_fn = stack[1].function if len(stack) > 1 else ""
-        caller_fn = stack[2].function if len(stack) > 2 else ""
-        caller_line = stack[2].lineno if len(stack) > 2 else 0
+    def _now(self) -> datetime.datetime:
+        """
+        Current time, or the timestamp pinned for the evaluation running on
+        this thread so one pass reads the clock once and sees a single "now".
+        """
+        now = getattr(self._eval_local, "now", None)
+        return datetime.datetime.now() if now is None else now
+
+    def _debug_log(self, message: str, *args) -> None:
+        """
+        Log a DEBUG message tagged with the calling method and its caller.
+
+        Optional ``args`` are %-formatted into ``message`` only when DEBUG is
+        enabled, so hot call sites can pass values instead of f-strings.
+        """
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        if args:
+            message = message % args
+
+        # sys._getframe reads the two frames we need directly; inspect.stack()
+        # would build FrameInfo (and read source context) for the whole stack.
+        current_frame = sys._getframe(1)
+        caller_frame = current_frame.f_back
+        current_fn = current_frame.f_code.co_name
+        caller_fn = caller_frame.f_code.co_name if caller_frame else ""
+        caller_line = caller_frame.f_lineno if caller_frame else 0
 
         if hasattr(self, "name"):
             self.logger.debug(
@@ -1,6 +1,6 @@
 import json
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 
 from .auto_lights_base import AutoLightsBase
 from .brightness_plan import BrightnessPlan
@@ -53,8 +53,13 @@ class AutoLightsConfig(AutoLightsBase):
         self._default_lock_duration = 0
         self._default_lock_extension_duration = 0
         self._global_behavior_variables = []
+        # var_ids of the list above, for has_variable's per-event lookup
+        self._global_behavior_var_ids = frozenset()
 
         self._zones = []
+        # var_id -> zones whose has_variable matches it, for
+        # zones_for_variable's per-event lookup; see index_zone_variables
+        self._zones_by_var_id: Dict[int, List[Zone]] = {}
         self._lighting_periods = []
 
         self._config_file = config
@@ -141,6 +146,9 @@ class AutoLightsConfig(AutoLightsBase):
         Each item should be a dictionary with 'var_id' (int) and 'var_value' (str).
         """
         self._global_behavior_variables = value
+        self._global_behavior_var_ids = frozenset(
+            behavior.get("var_id") for behavior in value
+        )
 
     def load_config(self) -> None:
         with open(self._config_file, "r", encoding="utf-8") as f:
@@ -195,6 +203,7 @@ class AutoLightsConfig(AutoLightsBase):
         # assign zone_index to each zone
         for idx, z in enumerate(self._zones):
             z.zone_index = idx
+        self.index_zone_variables()
 
         # now that every zone has a valid zone_index, push its initial states to Indigo
         for z in self._zones:
@@ -210,10 +219,23 @@ class AutoLightsConfig(AutoLightsBase):
         return self._zones
 
     def has_variable(self, var_id: int) -> bool:
-        for behavior in self.global_behavior_variables:
-            if behavior.get("var_id") == var_id:
-                return True
-        return False
+        return var_id in self._global_behavior_var_ids
+
+    def index_zone_variables(self) -> None:
+        """
+        Rebuild the var_id -> zones index used by zones_for_variable from
+        each zone's tracked_var_ids. Called when zones are loaded and when a
+        zone's variable changes.
+        """
+        index: Dict[int, List[Zone]] = {}
+        for zone in self._zones:
+            for var_id in zone.tracked_var_ids:
+                index.setdefault(var_id, []).append(zone)
+        self._zones_by_var_id = index
+
+    def zones_for_variable(self, var_id: int) -> List[Zone]:
+        """Return the zones whose has_variable(var_id) is True."""
+        return self._zones_by_var_id.get(var_id, [])
 
     def has_global_lights_off(self, zone) -> BrightnessPlan:
         """
@@ -228,10 +250,18 @@ class AutoLightsConfig(AutoLightsBase):
                 continue
             var_value = behavior.get("var_value")
             comp_type = behavior.get("comparison_type")
+            # a bad entry must not stop every zone's evaluation
+            if not var_id:
+                continue
             try:
-                current_value = indigo.variables[var_id].value
-                var_name = indigo.variables[var_id].name
-            except Exception:
+                # variable may have been deleted since the config was saved
+                if var_id not in indigo.variables:
+                    continue
+                var = indigo.variables[var_id]
+                current_value = var.value
+                var_name = var.name
+            except (AttributeError, KeyError, TypeError, ValueError) as e:
+                self._debug_log("Skipping global behavior variable %r: %s", var_id, e)
                 continue
             lc_current = str(current_value).lower()
             lc_var_value = str(var_value).lower()
@@ -1,5 +1,6 @@
 import datetime
 import logging
+from typing import Optional
 from .auto_lights_base import AutoLightsBase
 from .lighting_period_mode import LightingPeriodMode
 
@@ -132,12 +133,16 @@ class LightingPeriod(AutoLightsBase):
             instance.id = cfg["id"]
         return instance
 
-    def is_active_period(self) -> bool:
+    def is_active_period(self, current_time: Optional[datetime.time] = None) -> bool:
         """
         Determine if the current time falls within this lighting period.
 
+        Args:
+            current_time (datetime.time, optional): Time to test; defaults to now.
+
         Returns:
             bool: True if the current time is between from_time and to_time, False otherwise.
         """
-        current_time = datetime.datetime.now().time()
+        if current_time is None:
+            current_time = datetime.datetime.now().time()
         return self._from_time <= current_time <= self._to_time
@@ -0,0 +1,142 @@
+"""
+Scheduler Module - Auto Lights Plugin
+
+This module provides a single background thread for the plugin's delayed
+callbacks (lock expiration, lighting period transitions, presence grace):
+
+- Callbacks are kept in a heap ordered by monotonic deadline
+- One thread sleeps until the earliest deadline instead of one thread per timer
+- Cancelled entries are dropped lazily when they reach the head of the heap
+
+schedule() returns a TimerHandle whose cancel() matches threading.Timer, so
+callers that store and cancel timers do not need to know which one they hold.
+"""
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from typing import Callable, List, Optional, Tuple
+
+logger = logging.getLogger("Plugin")
+
+
+class TimerHandle:
+    """A scheduled callback; cancel() prevents it from running."""
+
+    __slots__ = ("deadline", "callback", "args", "cancelled")
+
+    def __init__(self, deadline: float, callback: Callable, args: tuple) -> None:
+        self.deadline = deadline
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+
+class Scheduler:
+    """
+    Runs callbacks after a delay on one shared daemon thread.
+
+    Callbacks run one at a time, so they should hand long work off (as
+    process_zone does with device writes) rather than block the thread.
+    """
+
+    def __init__(self, name: str = "AutoLightsScheduler") -> None:
+        self._name = name
+        self._heap: List[Tuple[float, int, TimerHandle]] = []
+        # tie-breaker so equal deadlines never compare TimerHandles
+        self._seq = itertools.count()
+        self._cv = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+
+    def schedule(self, delay: float, callback: Callable, *args) -> TimerHandle:
+        """
+        Run callback(*args) after delay seconds. Once shut down, returns an
+        already-cancelled handle and never starts the thread again.
+        """
+        handle = TimerHandle(time.monotonic() + max(delay, 0.0), callback, args)
+        with self._cv:
+            if self._stopped:
+                handle.cancel()
+                return handle
+            heapq.heappush(self._heap, (handle.deadline, next(self._seq), handle))
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name=self._name, daemon=True
+                )
+                self._thread.start()
+            self._cv.notify()
+        return handle
+
+    def shutdown(self) -> None:
+        """Stop the thread; pending callbacks are discarded."""
+        with self._cv:
+            self._stopped = True
+            for _, _, handle in self._heap:
+                handle.cancel()
+            self._heap.clear()
+            self._cv.notify()
+
+    def _next_due(self) -> Optional[TimerHandle]:
+        """Wait for and pop the next due, live handle; None once stopped."""
+        heap = self._heap
+        with self._cv:
+            while not self._stopped:
+                while heap and heap[0][2].cancelled:
+                    heapq.heappop(heap)
+                if not heap:
+                    self._cv.wait()
+                    continue
+                delay = heap[0][0] - time.monotonic()
+                if delay <= 0:
+                    return heapq.heappop(heap)[2]
+                self._cv.wait(delay)
+        return None
+
+    def _run(self) -> None:
+        while True:
+            handle = self._next_due()
+            if handle is None:
+                return
+            if handle.cancelled:
+                continue
+            try:
+                handle.callback(*handle.args)
+            except Exception:
+                logger.exception(f"Scheduled callback {handle.callback!r} failed")
+
+
+_scheduler: Optional[Scheduler] = None
+# set by shutdown_scheduler(); no new scheduler thread is started afterwards
+_scheduler_closed = False
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler() -> Scheduler:
+    """
+    Return the plugin-wide scheduler, creating it on first use. After
+    shutdown_scheduler() it is a stopped scheduler whose schedule() returns
+    already-cancelled handles.
+    """
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = Scheduler()
+            if _scheduler_closed:
+                _scheduler.shutdown()
+        return _scheduler
+
+
+def shutdown_scheduler() -> None:
+    """Stop the plugin-wide scheduler for good and drop any pending callbacks."""
+    global _scheduler_closed
+    with _scheduler_lock:
+        scheduler = _scheduler
+        _scheduler_closed = True
+    if scheduler is not None:
+        scheduler.shutdown()
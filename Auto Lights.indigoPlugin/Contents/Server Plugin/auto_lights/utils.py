@@ -7,6 +7,7 @@ This module provides utility functions for device control and state verification
 - State confirmation to ensure devices reach target states
 - Brightness and on/off control for various device types (dimmers, relays, SenseME fans)
 - Logging for device control operations
+- A per-evaluation snapshot of indigo.devices
 
 The functions in this module handle low-level device interaction and provide
 a consistent interface for controlling different types of Indigo devices.
@@ -23,38 +24,91 @@ except ImportError:
 logger = logging.getLogger("Plugin")
 
 
-def _check_confirm(device, target_level, target_bool) -> bool:
+class DeviceSnapshot(dict):
+    """
+    Memoizing view of indigo.devices for one zone evaluation.
+
+    Each device is fetched from Indigo on first access and reused for the
+    rest of the evaluation, so a pass that reads the same light several
+    times makes one server round trip per device. Only item access is
+    memoized; use indigo.devices for membership tests and iteration.
+    """
+
+    def __missing__(self, dev_id):
+        dev = self[dev_id] = indigo.devices[dev_id]
+        return dev
+
+
+def _confirm_dimmer(device, target_level, target_bool) -> bool:
+    return device.brightness == target_level
+
+
+def _confirm_relay(device, target_level, target_bool) -> bool:
+    want = target_bool if target_bool is not None else (target_level == 100)
+    return device.onState == want
+
+
+def _confirm_senseme(device, target_level, target_bool) -> bool:
+    return int(device.states.get("brightness", 0)) == target_level
+
+
+def _confirm_brightness_attr(device, target_level, target_bool) -> bool:
+    return int(device.brightness) == target_level
+
+
+def _confirm_brightness_state(device, target_level, target_bool) -> bool:
+    return int(device.states["brightness"]) == target_level
+
+
+def _confirm_unknown(device, target_level, target_bool) -> bool:
+    # Cannot confirm state — assume NOT at target so command is sent
+    return False
+
+
+def confirm_strategy(device):
+    """
+    Return the state-confirmation function for this kind of device.
+
+    The choice depends only on the device's class, plugin and state layout,
+    so callers that check the same device repeatedly can select it once and
+    pass it back in via the ``confirm`` argument.
+    """
+    if isinstance(device, indigo.DimmerDevice):
+        return _confirm_dimmer
+    if isinstance(device, indigo.RelayDevice):
+        return _confirm_relay
+    if device.pluginId == "com.pennypacker.indigoplugin.senseme":
+        return _confirm_senseme
+    if hasattr(device, "brightness"):
+        return _confirm_brightness_attr
+    if "brightness" in getattr(device, "states", {}):
+        return _confirm_brightness_state
+    return _confirm_unknown
+
+
+def _check_confirm(device, target_level, target_bool, confirm=None) -> bool:
     """Return True if the device's state matches the target values."""
     logger.log(
         5,
-        f"_check_confirm called for '{device.name}' with target_level={target_level}, target_bool={target_bool}"
+        "_check_confirm called for '%s' with target_level=%s, target_bool=%s",
+        device.name,
+        target_level,
+        target_bool,
     )
-    if isinstance(device, indigo.DimmerDevice):
-        result = device.brightness == target_level
-    elif isinstance(device, indigo.RelayDevice):
-        want = target_bool if target_bool is not None else (target_level == 100)
-        result = device.onState == want
-    else:
-        senseme = "com.pennypacker.indigoplugin.senseme"
-        if device.pluginId == senseme:
-            result = int(device.states.get("brightness", 0)) == target_level
-        elif hasattr(device, "brightness"):
-            result = int(device.brightness) == target_level
-        elif "brightness" in getattr(device, "states", {}):
-            result = int(device.states["brightness"]) == target_level
-        else:
-            # Cannot confirm state — assume NOT at target so command is sent
-            result = False
-    logger.log(5, f"_check_confirm result for '{device.name}': {result}")
+    if confirm is None:
+        confirm = confirm_strategy(device)
+    result = confirm(device, target_level, target_bool)
+    logger.log(5, "_check_confirm result for '%s': %s", device.name, result)
     return result
 
 
-def is_device_at_target(device, desired_brightness) -> bool:
+def is_device_at_target(device, desired_brightness, confirm=None) -> bool:
     """Return True if the given device is currently at the desired target.
 
     Accepts the same shape as the entries stored in zone.target_brightness
     (an int 0..100 or a bool). Wraps _check_confirm so callers don't have
     to translate between the int/bool target representations themselves.
+    ``confirm`` may be a cached result of confirm_strategy(device).
     """
     if isinstance(desired_brightness, bool):
         target_level = 100 if desired_brightness else 0
@@ -63,7 +117,7 @@ def is_device_at_target(device, desired_brightness) -> bool:
         target_level = int(desired_brightness)
         target_bool = None
     try:
-        return _check_confirm(device, target_level, target_bool)
+        return _check_confirm(device, target_level, target_bool, confirm)
     except Exception:
         return False
 
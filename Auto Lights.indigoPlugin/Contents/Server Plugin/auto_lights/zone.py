@@ -26,10 +26,12 @@ import datetime
 import json
 import logging
 import math
+import operator
 import threading
 import time
 from collections import deque
-from typing import Deque, List, Union, Optional, TYPE_CHECKING, Tuple, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Deque, List, Union, Optional, TYPE_CHECKING, Tuple, Any, Callable, Dict, FrozenSet
 
 from .auto_lights_base import AutoLightsBase
 from .brightness_plan import BrightnessPlan
@@ -39,6 +41,7 @@ if TYPE_CHECKING:
     from .auto_lights_config import AutoLightsConfig
 from . import utils
 from .lighting_period import LightingPeriod
+from .scheduler import TimerHandle, get_scheduler
 
 try:
     import indigo
@@ -60,6 +63,73 @@ MAX_CONSECUTIVE_FAILURES = 3
 MAX_REEVAL_BURST = 5
 REEVAL_WINDOW_SECONDS = 30.0
 
+# How far in the past an unlocked zone's lock_expiration is set
+UNLOCK_BACKDATE = datetime.timedelta(minutes=1)
+
+LOCK_EXPIRATION_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# lastChanged floor; sensors not changed since then have no "last change"
+_NEVER_CHANGED = datetime.datetime(1900, 1, 1)
+
+# Per-device brightness handling strategies. A device's Indigo class does
+# not change while the zone's device lists stay the same, so the kind is
+# classified once and reused instead of re-fetching the device each time.
+DEVICE_KIND_DIMMER = "dimmer"
+DEVICE_KIND_SWITCH = "switch"
+
+# Device writes (send + settle/confirm, at most a couple of seconds each)
+# run on a shared pool instead of a new thread per write. Writers never wait
+# on each other, so re-evaluations submitted from a worker cannot deadlock.
+MAX_WRITE_WORKERS = 8
+_write_executor: Optional[ThreadPoolExecutor] = None
+# set by shutdown_write_executor(); the pool is never recreated afterwards
+_write_executor_closed = False
+_write_executor_lock = threading.Lock()
+
+
+def _get_write_executor() -> Optional[ThreadPoolExecutor]:
+    """
+    Return the shared device-write pool, creating it on first use, or None
+    once shutdown_write_executor() has run.
+    """
+    global _write_executor
+    with _write_executor_lock:
+        if _write_executor is None and not _write_executor_closed:
+            _write_executor = ThreadPoolExecutor(
+                max_workers=MAX_WRITE_WORKERS, thread_name_prefix="AutoLightsWrite"
+            )
+        return _write_executor
+
+
+def shutdown_write_executor() -> None:
+    """
+    Stop the shared device-write pool for good, dropping writes not yet
+    started (their zones release them; see Zone.save_brightness_changes).
+    """
+    global _write_executor, _write_executor_closed
+    with _write_executor_lock:
+        executor, _write_executor = _write_executor, None
+        _write_executor_closed = True
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+# zone_index -> id of the zone's Indigo plugin device. Kept at module level
+# so Zone objects rebuilt on a config reload skip the scan over all devices.
+_ZONE_INDIGO_DEV_IDS: Dict[Any, int] = {}
+
+
+def _current_period_state(read: Callable[[LightingPeriod], str]) -> Callable:
+    """
+    Build a runtime-state getter that reads the zone's current lighting
+    period once and returns read(period), or "" when no period is active.
+    """
+
+    def getter(zone: "Zone") -> str:
+        period = zone.current_lighting_period
+        return read(period) if period else ""
+
+    return getter
+
 class Zone(AutoLightsBase):
     """
     Zone abstraction for Auto Lights.
@@ -84,8 +154,7 @@ class Zone(AutoLightsBase):
         zone_index (int): Index of the zone used for the Indigo device address.
     """
 
-    # (2) Class variables or constants would go here if we had any.
-
+    # (2) Class variables
     # ----------------------------------------------------------------
     # Which dynamic runtime‐states we will push into the zone device
     zone_indigo_device_runtime_states = [
@@ -93,37 +162,25 @@ class Zone(AutoLightsBase):
             "key": "current_period_name",
             "type": "string",
             "label": "Current Period",
-            "getter": lambda z: (
-                z.current_lighting_period.name if z.current_lighting_period else ""
-            ),
+            "getter": _current_period_state(operator.attrgetter("name")),
         },
         {
             "key": "current_period_mode",
             "type": "string",
             "label": "Mode",
-            "getter": lambda z: (
-                z.current_lighting_period.mode.value if z.current_lighting_period else ""
-            ),
+            "getter": _current_period_state(lambda p: p.mode.value),
         },
         {
             "key": "current_period_from",
             "type": "string",
             "label": "Start Time",
-            "getter": lambda z: (
-                z.current_lighting_period.from_time.strftime("%H:%M")
-                if z.current_lighting_period
-                else ""
-            ),
+            "getter": _current_period_state(lambda p: p.from_time.strftime("%H:%M")),
         },
         {
             "key": "current_period_to",
             "type": "string",
             "label": "End Time",
-            "getter": lambda z: (
-                z.current_lighting_period.to_time.strftime("%H:%M")
-                if z.current_lighting_period
-                else ""
-            ),
+            "getter": _current_period_state(lambda p: p.to_time.strftime("%H:%M")),
         },
         {
             "key": "presence_detected",
@@ -156,6 +213,10 @@ class Zone(AutoLightsBase):
             "getter": lambda z: z.get_device_states_string(),
         },
     ]
+    # key -> getter, so single-state lookups don't scan the table above
+    _runtime_state_getters = {
+        entry["key"]: entry["getter"] for entry in zone_indigo_device_runtime_states
+    }
     # ----------------------------------------------------------------
 
     # (3) Constructor
@@ -170,24 +231,55 @@ class Zone(AutoLightsBase):
         super().__init__()
         self.logger = logging.getLogger("Plugin")
         self._name = name
+        # Indigo device name is derived from the zone name; build it once
+        self._indigo_dev_name = f"Auto Lights Zone - {name}"
         self._zone_index = None
 
         self._lighting_periods = []
-        self._current_lighting_period = None
+        # (valid_from, valid_until, period): the active period and the window
+        # in which it is still correct, stored and read as one value so
+        # concurrent evaluations never pair one window with another period;
+        # None forces a re-evaluation
+        self._current_period_cache: Optional[
+            Tuple[datetime.datetime, datetime.datetime, Optional[LightingPeriod]]
+        ] = None
 
         # Device lists for lights
         self._on_lights_dev_ids = []
         self._off_lights_dev_ids = []
         self._exclude_from_lock_dev_ids = []
+        # set mirrors of the lists above for O(1) membership tests
+        self._on_lights_set: frozenset = frozenset()
+        self._exclude_from_lock_set: frozenset = frozenset()
+        # dev_id -> DEVICE_KIND_*; cleared whenever the light lists change
+        self._dev_kinds: dict[int, str] = {}
+        # dev_id -> utils.confirm_strategy() result; same lifetime as above
+        self._confirm_strategies: dict[int, Callable] = {}
+        # config form of the per-device lighting period mapping (string keys)
+        # and the (dev_id, period_id) int pairs it excludes, for O(1) checks
+        self._device_period_map: dict = {}
+        self._excluded_dev_periods: frozenset = frozenset()
 
         self._luminance_dev_ids = []
         self._luminance = 0
 
         self._presence_dev_ids = []
+        # ordered on+off light ids reported by current_lights_status, with
+        # and without the lock-excluded devices (see _rebuild_status_dev_ids)
+        self._status_dev_ids: List[int] = []
+        self._lockable_status_dev_ids: List[int] = []
+        # dev_id -> name of the device list it belongs to (see _has_device)
+        self._dev_id_category: dict[int, str] = {}
         self._minimum_luminance = 10000
         self._minimum_luminance_var_id = None
+        # last value read from the minimum luminance variable; cleared by
+        # invalidate_minimum_luminance() when Indigo reports a change
+        self._minimum_luminance_var_value: Optional[float] = None
 
         self._target_brightness = None
+        # derived from _target_brightness by the target_brightness setter
+        self._target_brightness_map: Dict[int, Union[int, bool]] = {}
+        self._target_brightness_all_off = False
 
         # Behavior flags and settings
         self._adjust_brightness = True
@@ -197,6 +289,8 @@ class Zone(AutoLightsBase):
         self._off_lights_behavior = "do not adjust unless no presence"
 
         self._lock_expiration = None
+        # formatted once per lock_expiration change; read on every lock log line
+        self._lock_expiration_str = ""
         self._lock_timer = None
         self._config = config
         # compute which schema-driven fields we sync back to the Indigo zone device
@@ -205,9 +299,14 @@ class Zone(AutoLightsBase):
             for key, schema in self._config.zone_field_schemas.items()
             if schema.get("x-sync_to_indigo")
         }
+        # attribute names (public and "_"-prefixed) whose writes __setattr__
+        # mirrors to Indigo; one membership test decides each write
+        self._sync_attr_names = frozenset(self.zone_indigo_device_config_states).union(
+            "_" + key for key in self.zone_indigo_device_config_states
+        )
 
         # Timer for scheduling next lighting-period transition
-        self._transition_timer: Optional[threading.Timer] = None
+        self._transition_timer: Optional[TimerHandle] = None
 
         self._lock_enabled = True
         self._lock_extension_duration = None
@@ -236,6 +335,10 @@ class Zone(AutoLightsBase):
 
         # Reentrancy guard to prevent infinite recursion during sync
         self._syncing = False
+        # attr -> (copy of the list last synced, its JSON); see _build_schema_states
+        self._sync_json_cache: Dict[str, Tuple[list, str]] = {}
+        # Set while from_config_dict applies settings, to batch their syncs
+        self._suspend_sync = False
 
     def __setattr__(self, name, value):
         """
@@ -245,74 +348,105 @@ class Zone(AutoLightsBase):
         # always let Python store the attribute
         super().__setattr__(name, value)
 
-        # --- BROAD GUARD: don't even think about syncing until after zone_index is set ---
-        if getattr(self, "_zone_index", None) is None:
+        # most writes are internal state; rule them out with one set lookup
+        # (_sync_attr_names only exists once __init__ has read the config)
+        attrs = self.__dict__
+        sync_names = attrs.get("_sync_attr_names")
+        if sync_names is None or name not in sync_names:
+            return
+
+        # don't sync until zone_index is set, while already syncing (prevents
+        # infinite recursion), or while from_config_dict batches its changes
+        if (
+            attrs.get("_zone_index") is None
+            or attrs.get("_syncing")
+            or attrs.get("_suspend_sync")
+        ):
             return
+        self.sync_indigo_device()
 
-        # now, if this is one of the fields we want to mirror back into Indigo, do it
-        # Skip if we're already syncing (prevents infinite recursion)
-        if hasattr(self, "_config") and not getattr(self, "_syncing", False):
-            key = name[1:] if name.startswith("_") else name
-            if key in self.zone_indigo_device_config_states:
-                self.sync_indigo_device()
+    # from_config_dict sections whose keys map 1:1 onto Zone properties, in
+    # the order they are applied
+    _CONFIG_SECTION_KEYS = (
+        (
+            "device_settings",
+            (
+                "on_lights_dev_ids",
+                "off_lights_dev_ids",
+                "luminance_dev_ids",
+                "presence_dev_ids",
+            ),
+        ),
+        ("minimum_luminance_settings", ("minimum_luminance", "adjust_brightness")),
+        (
+            "behavior_settings",
+            (
+                "lock_duration",
+                "extend_lock_when_active",
+                "lock_extension_duration",
+                "unlock_when_no_presence",
+                "off_lights_behavior",
+            ),
+        ),
+    )
 
     def from_config_dict(self, cfg: dict) -> None:
         """
         Updates the zone configuration based on a provided dictionary.
 
+        Per-attribute Indigo syncs are suspended while the settings are
+        applied; a zone that already has its device is synced once at the end.
+
         Args:
             cfg (dict): Configuration dictionary with keys
                         'device_settings', 'minimum_luminance_settings', and 'behavior_settings'.
         """
-        if "device_settings" in cfg:
-            ds = cfg["device_settings"]
-            if "on_lights_dev_ids" in ds:
-                self.on_lights_dev_ids = ds["on_lights_dev_ids"]
-            if "off_lights_dev_ids" in ds:
-                self.off_lights_dev_ids = ds["off_lights_dev_ids"]
-            if "luminance_dev_ids" in ds:
-                self.luminance_dev_ids = ds["luminance_dev_ids"]
-            if "presence_dev_ids" in ds:
-                self.presence_dev_ids = ds["presence_dev_ids"]
-            elif "presence_dev_id" in ds:
-                self.presence_dev_ids = [ds["presence_dev_id"]]
-        if "minimum_luminance_settings" in cfg:
-            mls = cfg["minimum_luminance_settings"]
-            if "minimum_luminance" in mls:
-                self.minimum_luminance = mls["minimum_luminance"]
+        self._suspend_sync = True
+        try:
+            self._apply_config_dict(cfg)
+        finally:
+            self._suspend_sync = False
+        if self._zone_index is not None:
+            self.sync_indigo_device()
+
+    def _apply_config_dict(self, cfg: dict) -> None:
+        """Apply a zone configuration dictionary; see from_config_dict."""
+        # plain "section.key -> same-named property" settings
+        for section, keys in self._CONFIG_SECTION_KEYS:
+            settings = cfg.get(section)
+            if settings is None:
+                continue
+            for key in keys:
+                if key in settings:
+                    setattr(self, key, settings[key])
+
+        ds = cfg.get("device_settings")
+        if ds is not None and "presence_dev_ids" not in ds and "presence_dev_id" in ds:
+            # legacy single presence device
+            self.presence_dev_ids = [ds["presence_dev_id"]]
+        mls = cfg.get("minimum_luminance_settings")
+        if mls is not None:
             if "minimum_luminance_use_variable" in mls:
                 use_var = mls["minimum_luminance_use_variable"]
                 if not use_var:
-                    self._minimum_luminance_var_id = None
+                    self.minimum_luminance_var_id = None
             if "minimum_luminance_var_id" in mls:
                 self.minimum_luminance_var_id = mls["minimum_luminance_var_id"]
-            if "adjust_brightness" in mls:
-                self.adjust_brightness = mls["adjust_brightness"]
         if "behavior_settings" in cfg:
-            bs = cfg["behavior_settings"]
-            if "lock_duration" in bs:
-                self.lock_duration = bs["lock_duration"]
-            if "extend_lock_when_active" in bs:
-                self.extend_lock_when_active = bs["extend_lock_when_active"]
-            if "lock_extension_duration" in bs:
-                self.lock_extension_duration = bs["lock_extension_duration"]
-            if "unlock_when_no_presence" in bs:
-                self.unlock_when_no_presence = bs["unlock_when_no_presence"]
-            if "off_lights_behavior" in bs:
-                self.off_lights_behavior = bs["off_lights_behavior"]
             # load the advanced_settings.exclude_from_lock_dev_ids from the config
             if "advanced_settings" in cfg:
                 adv = cfg["advanced_settings"]
                 if "exclude_from_lock_dev_ids" in adv:
                     self.exclude_from_lock_dev_ids = adv["exclude_from_lock_dev_ids"]
             if "device_period_map" in cfg:
-                self._device_period_map = cfg["device_period_map"]
+                self.device_period_map = cfg["device_period_map"]
             else:
-                self._device_period_map = {}
-                for dev_id in self._on_lights_dev_ids:
-                    self._device_period_map[str(dev_id)] = {
+                self.device_period_map = {
+                    str(dev_id): {
                         str(period.id): True for period in self.lighting_periods
                     }
+                    for dev_id in self._on_lights_dev_ids
+                }
             # load global behavior variables map
             if "global_behavior_variables_map" in cfg:
                 self._global_behavior_variables_map = cfg[
@@ -333,13 +467,14 @@ class Zone(AutoLightsBase):
     @name.setter
     def name(self, value: str) -> None:
         self._name = value
+        self._indigo_dev_name = f"Auto Lights Zone - {value}"
 
     @property
     def enabled(self) -> bool:
         """Indicates whether the zone is enabled via its Indigo Relay device."""
         try:
             result = bool(self.indigo_dev.onState)
-            self._debug_log(f"enabled={result}")
+            self._debug_log("enabled=%s", result)
             return result
         except Exception as e:
             self.logger.error(f"Zone '{self._name}': failed to read onState: {e}")
@@ -405,6 +540,9 @@ class Zone(AutoLightsBase):
     def exclude_from_lock_dev_ids(self, value: List[int]) -> None:
         # Normalize None to empty list
         self._exclude_from_lock_dev_ids = value if value is not None else []
+        self._exclude_from_lock_set = frozenset(self._exclude_from_lock_dev_ids)
+        self._rebuild_status_dev_ids()
+        self._rebuild_device_index()
 
     @property
     def on_lights_dev_ids(self) -> List[int]:
@@ -413,7 +551,13 @@ class Zone(AutoLightsBase):
 
     @on_lights_dev_ids.setter
     def on_lights_dev_ids(self, value: List[int]) -> None:
+        old_ids = self._on_lights_dev_ids
         self._on_lights_dev_ids = value
+        self._on_lights_set = frozenset(value)
+        if value != old_ids:
+            self._light_lists_changed()
+        self._rebuild_status_dev_ids()
+        self._rebuild_device_index()
 
     @property
     def off_lights_dev_ids(self) -> List[int]:
@@ -423,8 +567,28 @@ class Zone(AutoLightsBase):
     @off_lights_dev_ids.setter
     def off_lights_dev_ids(self, value: List[int]) -> None:
         # Remove any device ids that are also present in on_lights_dev_ids
-        cleaned = [dev for dev in value if dev not in self.on_lights_dev_ids]
+        on_set = self._on_lights_set
+        cleaned = [dev for dev in value if dev not in on_set]
+        old_ids = self._off_lights_dev_ids
         self._off_lights_dev_ids = cleaned
+        if cleaned != old_ids:
+            self._light_lists_changed()
+        self._rebuild_status_dev_ids()
+        self._rebuild_device_index()
+
+    def _light_lists_changed(self) -> None:
+        """
+        Drop state derived from the on/off light lists.
+
+        A target plan built for the old device set no longer lines up with
+        the zone's lights, so it is discarded; process_zone rebuilds the
+        baseline from current device state on its next run.
+        """
+        self._dev_kinds.clear()
+        self._confirm_strategies.clear()
+        self._target_brightness = None
+        self._target_brightness_map = {}
+        self._target_brightness_all_off = False
 
     @property
     def presence_dev_ids(self) -> List[int]:
@@ -434,6 +598,7 @@ class Zone(AutoLightsBase):
     @presence_dev_ids.setter
     def presence_dev_ids(self, value: List[int]) -> None:
         self._presence_dev_ids = value
+        self._rebuild_device_index()
 
     @property
     def luminance_dev_ids(self) -> List[int]:
@@ -443,16 +608,50 @@ class Zone(AutoLightsBase):
     @luminance_dev_ids.setter
     def luminance_dev_ids(self, value: List[int]) -> None:
         self._luminance_dev_ids = value
+        self._rebuild_device_index()
+
+    def _rebuild_status_dev_ids(self) -> None:
+        """Precompute the device order reported by current_lights_status."""
+        exclude = self._exclude_from_lock_set
+        self._status_dev_ids = self._on_lights_dev_ids + self._off_lights_dev_ids
+        self._lockable_status_dev_ids = [
+            dev_id for dev_id in self._status_dev_ids if dev_id not in exclude
+        ]
+
+    def _rebuild_device_index(self) -> None:
+        """
+        Rebuild the dev_id -> device list reverse index used by _has_device.
+
+        Lists are applied lowest precedence first so that a device present in
+        several lists resolves the same way the original sequential checks
+        did (exclude_from_lock first, then on, off, presence, luminance).
+        """
+        index = {}
+        for category in (
+            "luminance_dev_ids",
+            "presence_dev_ids",
+            "off_lights_dev_ids",
+            "on_lights_dev_ids",
+            "exclude_from_lock_dev_ids",
+        ):
+            for dev_id in getattr(self, "_" + category) or []:
+                index[dev_id] = category
+        self._dev_id_category = index
 
     @property
     def minimum_luminance(self) -> float:
         """
         Minimum luminance threshold for darkness check.
-        If a variable ID is set, always read the current value from Indigo.
+        If a variable ID is set, use the variable's value; it is read from
+        Indigo once and reused until invalidate_minimum_luminance() is called.
         """
         if self._minimum_luminance_var_id is not None:
+            if self._minimum_luminance_var_value is not None:
+                return self._minimum_luminance_var_value
             try:
-                return float(indigo.variables[self._minimum_luminance_var_id].value)
+                value = float(indigo.variables[self._minimum_luminance_var_id].value)
+                self._minimum_luminance_var_value = value
+                return value
             except Exception as e:
                 self.logger.error(
                     f"Zone '{self._name}': failed to read minimum_luminance_var_id {self._minimum_luminance_var_id}: {e}"
@@ -473,6 +672,9 @@ class Zone(AutoLightsBase):
     @minimum_luminance_var_id.setter
     def minimum_luminance_var_id(self, value: int) -> None:
         self._minimum_luminance_var_id = value
+        self._minimum_luminance_var_value = None
+        # keep AutoLightsConfig.zones_for_variable in step
+        self._config.index_zone_variables()
         if value is not None:
             try:
                 self._minimum_luminance = float(indigo.variables[value].value)
@@ -480,18 +682,25 @@ class Zone(AutoLightsBase):
                 self.logger.error(f"minimum_luminance_var_id {value} not found: {e}")
                 self._minimum_luminance = None
 
+    def invalidate_minimum_luminance(self) -> None:
+        """Forget the cached minimum luminance variable value."""
+        self._minimum_luminance_var_value = None
+
     @property
     def luminance(self) -> int:
         if "luminance" in self._runtime_cache:
             return self._runtime_cache["luminance"]
 
-        self._luminance = 0
-        if len(self.luminance_dev_ids) == 0:
+        dev_ids = self._luminance_dev_ids
+        if not dev_ids:
+            self._luminance = 0
             return 0
-        for devId in self.luminance_dev_ids:
-            self._luminance += indigo.devices[devId].sensorValue
-        self._luminance = int(self._luminance / len(self.luminance_dev_ids))
-        self._debug_log(f"computed luminance: {self._luminance}")
+        devices = self._devices()
+        # accumulate in a local; every self._luminance write goes through
+        # Zone.__setattr__, so assign the attribute only once
+        total = sum(devices[dev_id].sensorValue for dev_id in dev_ids)
+        self._luminance = int(total / len(dev_ids))
+        self._debug_log("computed luminance: %s", self._luminance)
         self._runtime_cache["luminance"] = self._luminance
         return self._luminance
 
@@ -501,73 +710,116 @@ class Zone(AutoLightsBase):
         By default this skips any device in exclude_from_lock_dev_ids;
         set include_lock_excluded=True to see *all* devices.
         """
-        status = []
-
-        def get_device_status(device):
-            if isinstance(device, indigo.DimmerDevice):
-                return int(device.brightness)
-            elif hasattr(device, "brightness"):
-                return int(device.brightness)
-            elif "brightness" in device.states:
-                return int(device.states["brightness"])
-            elif "brightnessLevel" in device.states:
-                return int(device.states["brightnessLevel"])
-
-            try:
-                return bool(device.onState)
-            except Exception as e:
-                self.logger.error(
-                    f"Zone '{self._name}': failed to read current state for device "
-                    f"{getattr(device, 'id', 'unknown')} ('{getattr(device, 'name', 'unknown')}'): {e}"
-                )
-                return False
+        devices = self._devices()
+        # on_lights first, then off_lights; exclusions are applied up front
+        dev_ids = (
+            self._status_dev_ids
+            if include_lock_excluded
+            else self._lockable_status_dev_ids
+        )
+        return [
+            {"dev_id": dev_id, "brightness": self._device_status(devices[dev_id])}
+            for dev_id in dev_ids
+        ]
 
-        # Gather on_lights
-        for dev_id in self.on_lights_dev_ids:
-            if not include_lock_excluded and dev_id in self.exclude_from_lock_dev_ids:
-                continue
-            status.append(
-                {
-                    "dev_id": dev_id,
-                    "brightness": get_device_status(indigo.devices[dev_id]),
-                }
-            )
+    def _device_status(self, device) -> Union[int, bool]:
+        """Current brightness (int) or on/off state (bool) of a light device."""
+        if isinstance(device, indigo.DimmerDevice):
+            return int(device.brightness)
+        elif hasattr(device, "brightness"):
+            return int(device.brightness)
+        elif "brightness" in device.states:
+            return int(device.states["brightness"])
+        elif "brightnessLevel" in device.states:
+            return int(device.states["brightnessLevel"])
 
-        # Gather off_lights
-        for dev_id in self.off_lights_dev_ids:
-            if not include_lock_excluded and dev_id in self.exclude_from_lock_dev_ids:
-                continue
-            status.append(
-                {
-                    "dev_id": dev_id,
-                    "brightness": get_device_status(indigo.devices[dev_id]),
-                }
+        try:
+            return bool(device.onState)
+        except Exception as e:
+            self.logger.error(
+                f"Zone '{self._name}': failed to read current state for device "
+                f"{getattr(device, 'id', 'unknown')} ('{getattr(device, 'name', 'unknown')}'): {e}"
             )
-        return status
+            return False
 
     @property
     def target_brightness(self) -> List[dict]:
         """Get the target brightness for zone devices."""
         return self._target_brightness
 
-    @staticmethod
+    @property
+    def target_brightness_map(self) -> Dict[int, Union[int, bool]]:
+        """Target brightness keyed by device id; maintained by the setter."""
+        return self._target_brightness_map
+
+    def begin_evaluation(self) -> bool:
+        """
+        Pin "now" (see _now) and a device snapshot for an evaluation on the
+        calling thread.
+
+        Returns False, pinning nothing, when this thread already has an
+        evaluation pinned; only a call that returned True should pair with
+        end_evaluation().
+        """
+        local = self._eval_local
+        if getattr(local, "dev_snapshot", None) is not None:
+            return False
+        local.now = datetime.datetime.now()
+        local.dev_snapshot = utils.DeviceSnapshot()
+        return True
+
+    def end_evaluation(self) -> None:
+        """Drop the calling thread's pinned evaluation state."""
+        local = self._eval_local
+        local.now = None
+        local.dev_snapshot = None
+
+    def _devices(self):
+        """
+        indigo.devices, or the snapshot this thread pinned in
+        begin_evaluation() so one evaluation fetches each device from the
+        server only once.
+        """
+        snapshot = getattr(self._eval_local, "dev_snapshot", None)
+        return indigo.devices if snapshot is None else snapshot
+
+    def _device_kind(self, dev_id: int) -> str:
+        """Return the cached DEVICE_KIND_* strategy for a light device."""
+        kind = self._dev_kinds.get(dev_id)
+        if kind is None:
+            if isinstance(self._devices()[dev_id], indigo.DimmerDevice):
+                kind = DEVICE_KIND_DIMMER
+            else:
+                kind = DEVICE_KIND_SWITCH
+            self._dev_kinds[dev_id] = kind
+        return kind
+
+    def _confirm_strategy(self, dev_id: int, dev) -> Callable:
+        """Return the cached utils.confirm_strategy() for a light device."""
+        confirm = self._confirm_strategies.get(dev_id)
+        if confirm is None:
+            confirm = utils.confirm_strategy(dev)
+            self._confirm_strategies[dev_id] = confirm
+        return confirm
+
     def _normalize_dev_target_brightness(
-        dev_id, brightness_value=None
+        self, dev_id, brightness_value=None
     ) -> Union[int, bool]:
         """
         Determine the correct brightness setting for the given device
         based on the input brightness_value.
         """
-        dev = indigo.devices[dev_id]
+        is_dimmer = self._device_kind(dev_id) == DEVICE_KIND_DIMMER
 
         if brightness_value is None:
-            if isinstance(dev, indigo.DimmerDevice):
+            dev = self._devices()[dev_id]
+            if is_dimmer:
                 brightness_value = dev.brightness
             else:
                 brightness_value = dev.onState
 
         # For dimmer devices:
-        if isinstance(dev, indigo.DimmerDevice):
+        if is_dimmer:
             # If numeric, cap it at 100; otherwise, allow bool/other to pass through
             if isinstance(brightness_value, int):
                 return min(brightness_value, 100)
@@ -594,70 +846,84 @@ class Zone(AutoLightsBase):
               - For other values, applies to on_lights devices first; then,
                 if not forcing off, off_lights are appended with their current state.
         """
-        # Reset internal state.
-        self._target_brightness = []
         if isinstance(value, list):
-            for item in value:
-                self._target_brightness.append(
-                    {
-                        "dev_id": item["dev_id"],
-                        "brightness": self._normalize_dev_target_brightness(
-                            item["dev_id"], item["brightness"]
-                        ),
-                    }
-                )
+            self._target_brightness = self._target_brightness_from_list(value)
         else:
-            force_off = (isinstance(value, bool) and not value) or value == 0
-            lights = (
-                self.on_lights_dev_ids + self.off_lights_dev_ids
-                if force_off
-                else self.on_lights_dev_ids
+            # False and 0 both mean "everything off" (False == 0)
+            self._target_brightness = self._target_brightness_from_scalar(
+                value, value == 0
             )
-            for dev_id in lights:
-                self._target_brightness.append(
-                    {
-                        "dev_id": dev_id,
-                        "brightness": self._normalize_dev_target_brightness(
-                            dev_id, value
-                        ),
-                    }
-                )
-            if not force_off:
-                for dev_id in self.off_lights_dev_ids:
-                    self._target_brightness.append(
-                        {
-                            "dev_id": dev_id,
-                            "brightness": self._normalize_dev_target_brightness(dev_id),
-                        }
-                    )
-        self._debug_log(
-            f"Set target_brightness to {self._target_brightness} with lock comparison {self._target_brightness_lock_comparison}"
+        self._target_brightness_map = target_map = {
+            item["dev_id"]: item["brightness"] for item in self._target_brightness
+        }
+        # bool subclasses int, so truthiness covers both "True" and "> 0"
+        self._target_brightness_all_off = bool(target_map) and not any(
+            target_map.values()
         )
+        # the lock-comparison list is rebuilt just for this message
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self._debug_log(
+                f"Set target_brightness to {self._target_brightness} with lock comparison {self._target_brightness_lock_comparison}"
+            )
+
+    def _target_brightness_from_list(self, values: List[dict]) -> List[dict]:
+        """Normalize an explicit list of {"dev_id", "brightness"} targets."""
+        normalize = self._normalize_dev_target_brightness
+        return [
+            {
+                "dev_id": item["dev_id"],
+                "brightness": normalize(item["dev_id"], item["brightness"]),
+            }
+            for item in values
+        ]
+
+    def _target_brightness_from_scalar(
+        self, value: Union[int, bool], force_off: bool
+    ) -> List[dict]:
+        """Apply one brightness to the on_lights and derive the off_lights."""
+        normalize = self._normalize_dev_target_brightness
+        targets = [
+            {"dev_id": dev_id, "brightness": normalize(dev_id, value)}
+            for dev_id in self._on_lights_dev_ids
+        ]
+        # off_lights are forced off too, or otherwise keep their current
+        # state (normalize reads it from the device when given None)
+        off_value = value if force_off else None
+        targets.extend(
+            {"dev_id": dev_id, "brightness": normalize(dev_id, off_value)}
+            for dev_id in self._off_lights_dev_ids
+        )
+        return targets
 
     @property
     def _target_brightness_lock_comparison(self) -> List[dict]:
         """Target brightness entries excluding devices excluded from lock detection."""
+        exclude = self._exclude_from_lock_set
         return [
-            item
-            for item in self.target_brightness
-            if item["dev_id"] not in self.exclude_from_lock_dev_ids
+            item for item in self.target_brightness if item["dev_id"] not in exclude
         ]
 
     @property
     def current_lighting_period(self) -> Optional[LightingPeriod]:
         """Current active lighting period, or None if no period is active."""
+        now = self._now()
+        cached = self._current_period_cache
+        if cached is not None and cached[0] <= now < cached[1]:
+            return cached[2]
+
+        current_time = now.time()
         active = None
         for period in self.lighting_periods:
-            if period.is_active_period():
+            if period.is_active_period(current_time):
                 active = period
                 break
 
-        # clear or update the cache
-        self._current_lighting_period = active
+        # clear or update the cache; it holds until a period starts or ends
+        self._current_period_cache = (now, self._next_period_boundary(now), active)
 
         if not active:
             self._debug_log(
-                f"Zone '{self._name}': no active lighting period right now."
+                "Zone '%s': no active lighting period right now.", self._name
             )
         return active
 
@@ -669,22 +935,40 @@ class Zone(AutoLightsBase):
     @lighting_periods.setter
     def lighting_periods(self, value: List[LightingPeriod]) -> None:
         self._lighting_periods = value
+        self._current_period_cache = None
+
+    def _next_period_boundary(self, now: datetime.datetime) -> datetime.datetime:
+        """
+        Earliest moment after ``now`` at which any lighting period starts or
+        ends, i.e. when current_lighting_period may change.
+        """
+        today = now.date()
+        # periods include their to_time, so they end just after it
+        just_after = datetime.timedelta(microseconds=1)
+        boundary = now + datetime.timedelta(days=1)
+        for period in self._lighting_periods:
+            for edge in (
+                datetime.datetime.combine(today, period.from_time),
+                datetime.datetime.combine(today, period.to_time) + just_after,
+            ):
+                if edge <= now:
+                    edge += datetime.timedelta(days=1)
+                boundary = min(boundary, edge)
+        return boundary
 
     @property
     def last_changed_device(self) -> indigo.Device:
         """Returns the indigo.Device with the most recent lastChanged value."""
-        latest_device = None
-        latest_time = datetime.datetime(1900, 1, 1)
-        for dev_id in self.presence_dev_ids:
-            dev = indigo.devices[dev_id]
-            if dev.lastChanged > latest_time:
-                latest_time = dev.lastChanged
-                latest_device = dev
-        for dev_id in self.luminance_dev_ids:
-            dev = indigo.devices[dev_id]
-            if dev.lastChanged > latest_time:
-                latest_time = dev.lastChanged
-                latest_device = dev
+        devices = self._devices()
+        # presence devices first: max() keeps the first of equal timestamps
+        dev_ids = self._presence_dev_ids + self._luminance_dev_ids
+        latest_device = max(
+            (devices[dev_id] for dev_id in dev_ids),
+            key=operator.attrgetter("lastChanged"),
+            default=None,
+        )
+        if latest_device is None or latest_device.lastChanged <= _NEVER_CHANGED:
+            return None
         return latest_device
 
     @property
@@ -722,11 +1006,9 @@ class Zone(AutoLightsBase):
         If a lighting period override is active and specifies a lock duration, that value is returned.
         Otherwise, the default configuration value is used.
         """
-        if (
-            self.current_lighting_period
-            and self.current_lighting_period.has_lock_duration_override
-        ):
-            return self.current_lighting_period.lock_duration
+        period = self.current_lighting_period
+        if period and period.has_lock_duration_override:
+            return period.lock_duration
         if self._lock_duration is None or self._lock_duration == -1:
             self._lock_duration = self._config.default_lock_duration
         return self._lock_duration
@@ -756,7 +1038,7 @@ class Zone(AutoLightsBase):
             return False
         if self._lock_expiration is None:
             return False
-        return datetime.datetime.now() < self._lock_expiration
+        return self._now() < self._lock_expiration
 
     @locked.setter
     def locked(self, value: bool) -> None:
@@ -770,21 +1052,19 @@ class Zone(AutoLightsBase):
         """
         if value:
             # record lock start time for no-presence grace period
-            self._lock_start_time = datetime.datetime.now()
-            new_expiration = datetime.datetime.now() + datetime.timedelta(
-                minutes=self.lock_duration
-            )
+            now = self._now()
+            self._lock_start_time = now
+            new_expiration = now + datetime.timedelta(minutes=self.lock_duration)
             self.lock_expiration = new_expiration
 
             # Schedule a background event to process the expiration of the lock.
-            now = datetime.datetime.now()
             delay = (self._lock_expiration - now).total_seconds()
             if delay > 0:
                 if self._lock_timer:
                     self._lock_timer.cancel()
-                self._lock_timer = threading.Timer(delay, self._process_expired_lock)
-                self._lock_timer.daemon = True
-                self._lock_timer.start()
+                self._lock_timer = get_scheduler().schedule(
+                    delay, self._process_expired_lock
+                )
 
             # schedule no-presence grace timer at lock-time
             if self.unlock_when_no_presence and not self.has_presence_detected():
@@ -792,13 +1072,9 @@ class Zone(AutoLightsBase):
                 old = agent._no_presence_timers.pop(self.name, None)
                 if old:
                     old.cancel()
-                t = threading.Timer(
-                    LOCK_HOLD_GRACE_SECONDS,
-                    lambda z=self: agent._unlock_after_grace(z),
+                agent._no_presence_timers[self.name] = get_scheduler().schedule(
+                    LOCK_HOLD_GRACE_SECONDS, agent._unlock_after_grace, self
                 )
-                t.daemon = True
-                agent._no_presence_timers[self.name] = t
-                t.start()
 
             self.logger.info(
                 f"Zone '{self._name}' locked until {self.lock_expiration_str}"
@@ -807,10 +1083,8 @@ class Zone(AutoLightsBase):
             if self._lock_timer is not None:
                 self._lock_timer.cancel()
                 self._lock_timer = None
-            self._lock_expiration = datetime.datetime.now() - datetime.timedelta(
-                minutes=1
-            )
-            self._debug_log(f"Zone '{self._name}' unlocked")
+            self.lock_expiration = self._now() - UNLOCK_BACKDATE
+            self._debug_log("Zone '%s' unlocked", self._name)
         # Immediately refresh zone device UI after lock state change
         try:
             self.sync_indigo_device()
@@ -820,9 +1094,7 @@ class Zone(AutoLightsBase):
     @property
     def lock_expiration_str(self) -> str:
         """Formatted lock expiration timestamp, empty if no expiration."""
-        if self._lock_expiration is None:
-            return ""
-        return self._lock_expiration.strftime("%Y-%m-%d %H:%M:%S")
+        return self._lock_expiration_str
 
     @property
     def lock_expiration(self) -> datetime.datetime:
@@ -832,11 +1104,15 @@ class Zone(AutoLightsBase):
     @lock_expiration.setter
     def lock_expiration(self, value: Union[str, datetime.datetime]) -> None:
         if isinstance(value, str):
-            self._lock_expiration = datetime.datetime.strptime(
-                value, "%Y-%m-%d %H:%M:%S"
-            )
-        else:
-            self._lock_expiration = value
+            if value == self._lock_expiration_str:
+                return
+            # LOCK_EXPIRATION_FORMAT is ISO 8601 with a space separator, which
+            # fromisoformat accepts without strptime's format/locale handling
+            value = datetime.datetime.fromisoformat(value)
+        self._lock_expiration = value
+        self._lock_expiration_str = (
+            value.strftime(LOCK_EXPIRATION_FORMAT) if value is not None else ""
+        )
 
     @property
     def target_brightness_all_off(self) -> bool:
@@ -844,22 +1120,12 @@ class Zone(AutoLightsBase):
         Check if all devices' target brightness indicate an off state.
 
         For dimmer devices, 0 means off; for relay devices, False means off.
+        Computed once by the target_brightness setter.
 
         Returns:
             bool: True if all devices are set to off, False otherwise.
         """
-        targets = self.target_brightness or []
-        if not targets:
-            return False
-
-        for tb in targets:
-            desired = tb["brightness"] if isinstance(tb, dict) else tb
-            if isinstance(desired, bool):
-                if desired:
-                    return False
-            elif desired != 0:
-                return False
-        return True
+        return self._target_brightness_all_off
 
     # (5) Public methods
     def has_presence_detected(self) -> bool:
@@ -875,12 +1141,17 @@ class Zone(AutoLightsBase):
         if "presence" in self._runtime_cache:
             return self._runtime_cache["presence"]
 
-        for dev_id in self.presence_dev_ids:
-            presence_device = indigo.devices[dev_id]
-            state_on = presence_device.states.get("onState", False)
-            state_onoff = presence_device.states.get("onOffState", False)
+        devices = self._devices()
+        for dev_id in self._presence_dev_ids:
+            presence_device = devices[dev_id]
+            states = presence_device.states
+            state_on = states.get("onState", False)
+            state_onoff = states.get("onOffState", False)
             self._debug_log(
-                f"Presence device '{presence_device.name}' onOffState: {state_onoff}, onState: {state_on}"
+                "Presence device '%s' onOffState: %s, onState: %s",
+                presence_device.name,
+                state_onoff,
+                state_on,
             )
             detected = state_onoff or state_on
             if detected:
@@ -904,28 +1175,37 @@ class Zone(AutoLightsBase):
 
         if not self.luminance_dev_ids:
             self._debug_log(
-                f"Zone '{self._name}': is_dark: No luminance devices, returning True"
+                "Zone '%s': is_dark: No luminance devices, returning True", self._name
             )
             return True
 
         # Fetch sensor values safely; if a device doesn't have a sensorValue, you can decide on a default behavior.
-        sensor_values = [
-            indigo.devices[dev_id].sensorValue
-            for dev_id in self.luminance_dev_ids
-            if hasattr(indigo.devices[dev_id], "sensorValue")
-        ]
-
-        if not sensor_values:
+        devices = self._devices()
+        total = 0
+        count = 0
+        for dev_id in self._luminance_dev_ids:
+            dev = devices[dev_id]
+            if hasattr(dev, "sensorValue"):
+                total += dev.sensorValue
+                count += 1
+
+        if not count:
             self._debug_log(
-                f"Zone '{self._name}': is_dark: No valid sensor values available, returning True"
+                "Zone '%s': is_dark: No valid sensor values available, returning True",
+                self._name,
             )
             return True
 
-        avg = sum(sensor_values) / len(sensor_values)
+        avg = total / count
+        # minimum_luminance may read an Indigo variable; fetch it once
+        minimum_luminance = self.minimum_luminance
         self._debug_log(
-            f"Zone '{self._name}': Calculated average luminance: {avg} (minimum required: {self.minimum_luminance})."
+            "Zone '%s': Calculated average luminance: %s (minimum required: %s).",
+            self._name,
+            avg,
+            minimum_luminance,
         )
-        result = avg < self.minimum_luminance
+        result = avg < minimum_luminance
         self._runtime_cache["is_dark"] = result
         return result
 
@@ -938,24 +1218,21 @@ class Zone(AutoLightsBase):
         Returns:
             bool: True if any light is on, False otherwise.
         """
-        for status in self.current_lights_status():
-            if status is True or (isinstance(status, (int, float)) and status > 0):
-                return True
-        return False
+        return any(status["brightness"] for status in self.current_lights_status())
 
     def check_in(self):
         """
         Mark the zone as checked in (not being processed).
         """
         self._checked_out = False
-        self._debug_log(f"Zone '{self.name}' checked in")
+        self._debug_log("Zone '%s' checked in", self._name)
 
     def check_out(self):
         """
         Mark the zone as checked out (currently being processed).
         """
         self._checked_out = True
-        self._debug_log(f"Zone '{self.name}' checked out")
+        self._debug_log("Zone '%s' checked out", self._name)
 
     def reset_lock(self, reason: str):
         """
@@ -1009,39 +1286,42 @@ class Zone(AutoLightsBase):
         Returns:
             bool: True if any device's current state differs from its target, False otherwise.
         """
-        if not self.enabled or not self.target_brightness:
+        target_map = self._target_brightness_map
+        if not self.enabled or not target_map:
             self._debug_log(
                 "has_brightness_changes: returning False because zone disabled or no target brightness"
             )
             return False
 
-        # Build a lookup of current hardware states
-        current = {
-            item["dev_id"]: item["brightness"]
-            for item in self.current_lights_status(include_lock_excluded=True)
-        }
+        # Fetch each device once and compare it against its target directly,
+        # rather than snapshotting every light first and looking it up again.
+        devices = self._devices()
+        zone_lights = set(self._on_lights_dev_ids)
+        zone_lights.update(self._off_lights_dev_ids)
         # Compare each target to its actual brightness/state
-        for tgt in self.target_brightness:
-            dev_id = tgt["dev_id"]
-            if exclude_lock_devices and dev_id in self.exclude_from_lock_dev_ids:
+        for dev_id, desired in target_map.items():
+            if exclude_lock_devices and dev_id in self._exclude_from_lock_set:
                 continue
 
             if self._is_device_suppressed(dev_id):
                 continue
 
-            desired = tgt["brightness"]
-            if dev_id not in current:
-                # skip devices that aren’t reported in the current status
+            if dev_id not in zone_lights:
+                # skip devices that aren’t one of this zone's lights
                 self._debug_log(
-                    f"has_brightness_changes: skipping missing device {dev_id}"
+                    "has_brightness_changes: skipping missing device %s", dev_id
                 )
                 continue
 
-            actual = current[dev_id]
-            at_target = utils.is_device_at_target(indigo.devices[dev_id], desired)
-            self._debug_log(
-                f"has_brightness_changes: device {dev_id}: desired={desired}, actual={actual}, at_target={at_target}"
+            dev = devices[dev_id]
+            at_target = utils.is_device_at_target(
+                dev, desired, self._confirm_strategy(dev_id, dev)
             )
+            if self.logger.isEnabledFor(logging.DEBUG):
+                actual = self._device_status(dev)
+                self._debug_log(
+                    f"has_brightness_changes: device {dev_id}: desired={desired}, actual={actual}, at_target={at_target}"
+                )
             if not at_target:
                 return True
 
@@ -1053,32 +1333,34 @@ class Zone(AutoLightsBase):
         Apply and confirm the target brightness changes for this zone's devices.
 
         We batch up only those writes whose devices are not already at target,
-        set pending_writes once, then spawn one thread per write. The final
-        thread to complete will call check_in(), so we don’t prematurely check
-        in.
+        set pending_writes once, then submit one job per write to the shared
+        write pool. The final job to complete will call check_in(), so we
+        don’t prematurely check in.
         """
         # 1) Gather all writes from the computed target plan.
         writes: List[tuple[int, Union[int, bool]]] = []
-        ordered_targets = list(self.target_brightness or [])
+        ordered_targets = list(self._target_brightness_map.items())
         if self.target_brightness_all_off:
-            ordered_targets.sort(
-                key=lambda item: 0 if item["dev_id"] in self.off_lights_dev_ids else 1
-            )
-
-        for item in ordered_targets:
-            dev_id = item["dev_id"]
-            desired = item["brightness"]
+            off_ids = set(self._off_lights_dev_ids)
+            ordered_targets.sort(key=lambda item: 0 if item[0] in off_ids else 1)
 
+        # bound once for the loop; indigo.devices is a proxy into the server
+        devices = self._devices()
+        is_device_at_target = utils.is_device_at_target
+        for dev_id, desired in ordered_targets:
             if self._is_device_suppressed(dev_id):
                 continue
 
-            if utils.is_device_at_target(indigo.devices[dev_id], desired):
+            dev = devices[dev_id]
+            if is_device_at_target(dev, desired, self._confirm_strategy(dev_id, dev)):
                 self._debug_log(
-                    f"save_brightness_changes: device {dev_id} already at target {desired}"
+                    "save_brightness_changes: device %s already at target %s",
+                    dev_id,
+                    desired,
                 )
                 continue
 
-            self._debug_log(f"Setting device {dev_id} to {desired}")
+            self._debug_log("Setting device %s to %s", dev_id, desired)
             writes.append((dev_id, desired))
 
         # If there’s nothing to do, check in immediately
@@ -1087,16 +1369,24 @@ class Zone(AutoLightsBase):
             self.check_in()
             return
 
+        executor = _get_write_executor()
+        if executor is None:
+            self._debug_log("save_brightness_changes: write pool shut down, checking in")
+            self.check_in()
+            return
+
         # 2) Set the pending-write count up front
         with self._write_lock:
             self._pending_writes = len(writes)
 
-        # 3) Spawn one thread per write
+        # 3) Submit one pool job per write
         for dev_id, desired in writes:
 
             def _writer(dev_id=dev_id, desired_brightness=desired):
                 self._debug_log(
-                    f"starting write for device {dev_id}, value {desired_brightness}"
+                    "starting write for device %s, value %s",
+                    dev_id,
+                    desired_brightness,
                 )
                 should_process = False
                 try:
@@ -1133,7 +1423,9 @@ class Zone(AutoLightsBase):
                 with self._write_lock:
                     self._pending_writes -= 1
                     self._debug_log(
-                        f"completed write for device {dev_id}, pending_writes={self._pending_writes}"
+                        "completed write for device %s, pending_writes=%s",
+                        dev_id,
+                        self._pending_writes,
                     )
                     if self._pending_writes == 0:
                         self.check_in()
@@ -1148,8 +1440,34 @@ class Zone(AutoLightsBase):
                 if should_process and self._can_reeval():
                     self._config.agent.process_zone(self)
 
-            t = threading.Thread(target=_writer, daemon=True)
-            t.start()
+            def _release_if_cancelled(future, dev_id=dev_id):
+                # shutdown_write_executor() cancels queued jobs; the writer
+                # never runs, so release its pending write here instead
+                if future.cancelled():
+                    self._release_unsent_write(dev_id)
+
+            try:
+                future = executor.submit(_writer)
+            except RuntimeError:
+                # the pool was shut down after we looked it up
+                self._release_unsent_write(dev_id)
+                continue
+            future.add_done_callback(_release_if_cancelled)
+
+    def _release_unsent_write(self, dev_id: int) -> None:
+        """
+        Account for a write that was counted in _pending_writes but will
+        never run, checking the zone in once nothing is left in flight.
+        """
+        with self._write_lock:
+            self._pending_writes -= 1
+            self._debug_log(
+                "dropped write for device %s, pending_writes=%s",
+                dev_id,
+                self._pending_writes,
+            )
+            if self._pending_writes == 0:
+                self.check_in()
 
     def _write_debug_output(self, config) -> str:
         """
@@ -1173,6 +1491,13 @@ class Zone(AutoLightsBase):
                 lines.append(f"{key}: {repr(value)}")
         return "\n".join(lines)
 
+    def _current_status_map(self) -> dict:
+        """dev_id -> current brightness/state for all lights, in status order."""
+        return {
+            s["dev_id"]: s["brightness"]
+            for s in self.current_lights_status(include_lock_excluded=True)
+        }
+
     def calculate_target_brightness(self) -> BrightnessPlan:
         """
         Calculate and return a BrightnessPlan explaining lighting actions based on:
@@ -1185,13 +1510,14 @@ class Zone(AutoLightsBase):
         """
         self._runtime_cache.clear()
         self._debug_log("Calculating target brightness plan")
+        devices = self._devices()
         # GLOBAL PLUGIN DISABLED: plugin globally disabled, turn all lights off
         if not self._config.enabled:
             all_devs = self.on_lights_dev_ids + self.off_lights_dev_ids
             new_targets = [{"dev_id": d, "brightness": 0} for d in all_devs]
             device_changes = []
             for d in all_devs:
-                dev = indigo.devices[d]
+                dev = devices[d]
                 device_changes.append(["🔌", f"turned off '{dev.name}'"])
             return BrightnessPlan(
                 contributions=[],
@@ -1239,6 +1565,9 @@ class Zone(AutoLightsBase):
             plan_contribs.append(("⚖️", f"limit_brightness override = {limit_b}"))
 
         new_targets: List[dict] = []
+        # dev_id -> current brightness/state of every light (lock-excluded
+        # included); read at most once per plan
+        current: Optional[dict] = None
 
         # -- Handle 'Off Only' mode: only turn off when no presence
         if period.mode == LightingPeriodMode.OFF_ONLY:
@@ -1250,37 +1579,35 @@ class Zone(AutoLightsBase):
                     device_changes=[],
                 )
             contributions = [("👥", "no presence → turning all off")]
-            new_targets = [
-                {"dev_id": s["dev_id"], "brightness": 0}
-                for s in self.current_lights_status(include_lock_excluded=True)
-            ]
-            current = {
-                s["dev_id"]: s["brightness"]
-                for s in self.current_lights_status(include_lock_excluded=True)
-            }
+            current = self._current_status_map()
+            new_targets = [{"dev_id": d, "brightness": 0} for d in current]
             device_changes = []
             for t in new_targets:
                 did, new_b = t["dev_id"], t["brightness"]
                 old_b = current.get(did)
                 if old_b is not None and old_b != new_b:
-                    dev = indigo.devices[did]
+                    dev = devices[did]
                     device_changes.append(["🔌", f"turned off '{dev.name}'"])
             return BrightnessPlan(contributions, [], new_targets, device_changes)
         # -- Handle 'On and Off' mode when presence is detected and it's dark
         elif period.mode is LightingPeriodMode.ON_AND_OFF and presence and darkness:
             plan_contribs.append(("💡", "presence & dark → turning on lights"))
+            # every included on-light gets the same level; compute it on the
+            # first included light and reuse it for the rest
+            brightness = None
             for dev_id in self.on_lights_dev_ids:
                 excluded = self.has_dev_lighting_mapping_exclusion(dev_id, period)
                 if excluded:
-                    plan_exclusions.append(["❌", f"{indigo.devices[dev_id].name} is excluded from current period"])
+                    plan_exclusions.append(["❌", f"{devices[dev_id].name} is excluded from current period"])
                     continue
-                if not self.adjust_brightness:
-                    brightness = 100
-                else:
-                    raw = math.ceil(
-                        (1 - (self.luminance / self.minimum_luminance)) * 100
-                    )
-                    brightness = min(raw, limit_b) if limit_b is not None else raw
+                if brightness is None:
+                    if not self.adjust_brightness:
+                        brightness = 100
+                    else:
+                        raw = math.ceil(
+                            (1 - (self.luminance / self.minimum_luminance)) * 100
+                        )
+                        brightness = min(raw, limit_b) if limit_b is not None else raw
                 new_targets.append({"dev_id": dev_id, "brightness": brightness})
 
             # force-off any on-lights that are excluded from this period,
@@ -1304,15 +1631,11 @@ class Zone(AutoLightsBase):
                 plan_contribs.append(("☀️", "zone is bright enough → turning all off"))
 
             # include *all* lights (even those excluded from locks) in our off-targets
-            new_targets = [
-                {"dev_id": d["dev_id"], "brightness": 0}
-                for d in self.current_lights_status(include_lock_excluded=True)
-            ]
+            current = self._current_status_map()
+            new_targets = [{"dev_id": d, "brightness": 0} for d in current]
 
-        current = {
-            d["dev_id"]: d["brightness"]
-            for d in self.current_lights_status(include_lock_excluded=True)
-        }
+        if current is None:
+            current = self._current_status_map()
 
         # -- Compare current vs new targets to build device_changes
         device_changes: List[Tuple[str, str]] = []
@@ -1320,7 +1643,7 @@ class Zone(AutoLightsBase):
             did, new_b = t["dev_id"], t["brightness"]
             old_b = current.get(did)
             if old_b is not None and old_b != new_b:
-                device = indigo.devices[did]
+                device = devices[did]
 
                 # Determine change style: off always on/off, on for relays, brightness-up for dimmers
                 if new_b == 0:
@@ -1361,6 +1684,13 @@ class Zone(AutoLightsBase):
     @device_period_map.setter
     def device_period_map(self, value: dict) -> None:
         self._device_period_map = value
+        # only an explicit False excludes; missing entries default to included
+        self._excluded_dev_periods = frozenset(
+            (int(dev_id), int(period_id))
+            for dev_id, periods in value.items()
+            for period_id, included in periods.items()
+            if included is False
+        )
 
     def has_dev_lighting_mapping_exclusion(
         self, dev_id: int, lighting_period: LightingPeriod
@@ -1379,17 +1709,14 @@ class Zone(AutoLightsBase):
             bool: True if the device is excluded from the lighting period,
                   False if the device should be controlled by the lighting period
         """
-        cache_key = f"excl_{dev_id}_{lighting_period.id}"
-        if cache_key in self._runtime_cache:
-            return self._runtime_cache[cache_key]
-
-        device_map = self.device_period_map.get(str(dev_id), {})
-        result = device_map.get(str(lighting_period.id), True) is False
-        self._runtime_cache[cache_key] = result
+        result = (dev_id, lighting_period.id) in self._excluded_dev_periods
         self._debug_log(
-            f"has_dev_lighting_mapping_exclusion: dev_id={dev_id}, period={lighting_period.name}, device_map={device_map}, result={result}"
+            "has_dev_lighting_mapping_exclusion: dev_id=%s, period=%s, result=%s",
+            dev_id,
+            lighting_period.name,
+            result,
         )
-        self._debug_log(f"has_device: dev_id={dev_id}, result={result}")
+        self._debug_log("has_device: dev_id=%s, result=%s", dev_id, result)
         return result
 
     @property
@@ -1410,27 +1737,33 @@ class Zone(AutoLightsBase):
         if self._indigo_dev_id is not None:
             return indigo.devices[self._indigo_dev_id]
 
+        # Reuse the device found by an earlier Zone with the same zone_index,
+        # as long as it still exists and still belongs to that zone
+        cached_id = _ZONE_INDIGO_DEV_IDS.get(self.zone_index)
+        if cached_id is not None and cached_id in indigo.devices:
+            d = indigo.devices[cached_id]
+            if self._is_own_indigo_dev(d):
+                self._indigo_dev_id = d.id
+                return d
+
         # Try to find an existing plugin device with our zone_index
         for d in indigo.devices:
-            if (
-                d.pluginId == "com.vtmikel.autolights"
-                and d.deviceTypeId == "auto_lights_zone"
-                and d.pluginProps.get("zone_index") == self.zone_index
-            ):
+            if self._is_own_indigo_dev(d):
                 self._indigo_dev_id = d.id
+                _ZONE_INDIGO_DEV_IDS[self.zone_index] = d.id
                 return d
 
         # Didn't find it, so attempt to create one
         try:
-            name = f"Auto Lights Zone - {self.name}"
             dev = indigo.device.create(
                 protocol=indigo.kProtocol.Plugin,
-                name=name,
+                name=self._indigo_dev_name,
                 address=self.zone_index,
                 deviceTypeId="auto_lights_zone",
                 props={"zone_index": self.zone_index},
             )
             self._indigo_dev_id = dev.id
+            _ZONE_INDIGO_DEV_IDS[self.zone_index] = dev.id
             indigo.device.turnOn(dev.id, delay=0)
             self.logger.info(
                 f"🆕 Created new Indigo device for Zone '{self.name}' (id: {dev.id})"
@@ -1442,36 +1775,51 @@ class Zone(AutoLightsBase):
             )
             return None
 
+    def _is_own_indigo_dev(self, dev) -> bool:
+        """True if dev is this zone's Auto Lights zone device."""
+        return (
+            dev.pluginId == "com.vtmikel.autolights"
+            and dev.deviceTypeId == "auto_lights_zone"
+            and dev.pluginProps.get("zone_index") == self.zone_index
+        )
+
     def _build_schema_states(self, dev):
         """Collect states based on schema-driven sync attributes."""
         states = []
+        dev_states = dev.states
+        json_cache = self._sync_json_cache
         for attr in self.zone_indigo_device_config_states:
-            if attr in dev.states:
+            if attr in dev_states:
                 val = getattr(self, attr)
-                states.append(
-                    {
-                        "key": attr,
-                        "value": json.dumps(val) if isinstance(val, list) else val,
-                    }
-                )
+                if isinstance(val, list):
+                    # device-id lists rarely change between syncs; reuse the
+                    # last encoding while the contents are equal
+                    cached = json_cache.get(attr)
+                    if cached is not None and cached[0] == val:
+                        val = cached[1]
+                    else:
+                        encoded = json.dumps(val)
+                        json_cache[attr] = (list(val), encoded)
+                        val = encoded
+                states.append({"key": attr, "value": val})
         return states
 
     def _get_runtime_state_value(self, key):
         """
         Retrieve the runtime state value for the given key using the getter in config.zone_indigo_device_runtime_states.
         """
-        for entry in self.zone_indigo_device_runtime_states:
-            if entry.get("key") == key:
-                return entry["getter"](self)
-        return None
+        getter = self._runtime_state_getters.get(key)
+        return getter(self) if getter is not None else None
 
     def _build_runtime_states(self, dev):
         """Collect dynamic runtime states for Indigo device."""
         states = []
+        dev_states = dev.states
+        # walk the table once, calling each getter directly
         for entry in self.zone_indigo_device_runtime_states:
             key = entry["key"]
-            if key in dev.states:
-                val = self._get_runtime_state_value(key)
+            if key in dev_states:
+                val = entry["getter"](self)
                 if val is not None:
                     states.append({"key": key, "value": val})
         return states
@@ -1498,7 +1846,7 @@ class Zone(AutoLightsBase):
         self._syncing = True
         try:
             # Update device name to match zone name
-            expected_name = f"Auto Lights Zone - {self.name}"
+            expected_name = self._indigo_dev_name
             if dev.name != expected_name:
                 try:
                     dev.name = expected_name
@@ -1516,13 +1864,23 @@ class Zone(AutoLightsBase):
             # Append dynamic runtime states
             state_list.extend(self._build_runtime_states(dev))
 
-            try:
-                if hasattr(dev, "updateStatesOnServer"):
-                    dev.updateStatesOnServer(state_list)
-                else:
-                    self.logger.debug("Device does not support updateStatesOnServer, skipping update")
-            except Exception as e:
-                self.logger.error(f"Failed to sync states for zone '{self._name}': {e}")
+            # push only the states whose value differs from what the device
+            # already holds; most syncs change one or two of them, if any
+            dev_states = dev.states
+            state_list = [
+                state
+                for state in state_list
+                if dev_states.get(state["key"]) != state["value"]
+            ]
+
+            if state_list:
+                try:
+                    if hasattr(dev, "updateStatesOnServer"):
+                        dev.updateStatesOnServer(state_list)
+                    else:
+                        self.logger.debug("Device does not support updateStatesOnServer, skipping update")
+                except Exception as e:
+                    self.logger.error(f"Failed to sync states for zone '{self._name}': {e}")
             # Update onOffState with UI value
             try:
                 on_state = dev.onState
@@ -1557,21 +1915,9 @@ class Zone(AutoLightsBase):
                  Possible values: "exclude_from_lock_dev_ids", "on_lights_dev_ids",
                  "off_lights_dev_ids", "presence_dev_ids", "luminance_dev_ids", or "".
         """
-        if dev_id in self.exclude_from_lock_dev_ids:
-            result = "exclude_from_lock_dev_ids"
-        elif dev_id in self._on_lights_dev_ids:
-            result = "on_lights_dev_ids"
-        elif dev_id in self._off_lights_dev_ids:
-            result = "off_lights_dev_ids"
-        elif dev_id in self._presence_dev_ids:
-            result = "presence_dev_ids"
-        elif dev_id in self._luminance_dev_ids:
-            result = "luminance_dev_ids"
-        else:
-            result = ""
-
+        result = self._dev_id_category.get(dev_id, "")
         if result:
-            self._debug_log(f"has_device: dev_id={dev_id}, result={result}")
+            self._debug_log("has_device: dev_id=%s, result=%s", dev_id, result)
         return result
 
     def schedule_next_transition(self):
@@ -1582,14 +1928,14 @@ class Zone(AutoLightsBase):
         """
         if not self.lighting_periods:
             self._debug_log(
-                f"Zone '{self._name}' has no lighting periods; skipping scheduling"
+                "Zone '%s' has no lighting periods; skipping scheduling", self._name
             )
             return
         # 1) cancel old
         if self._transition_timer:
             self._transition_timer.cancel()
 
-        now = datetime.datetime.now()
+        now = self._now()
         next_dt = None
         next_period = None
         next_boundary = None  # "from_time" or "to_time"
@@ -1619,15 +1965,15 @@ class Zone(AutoLightsBase):
         assert next_dt and next_period and next_boundary
 
         delay = (next_dt - now).total_seconds()
-        self._transition_timer = threading.Timer(
-            delay,
-            self._on_transition,
-            args=(next_period, next_boundary),
+        self._transition_timer = get_scheduler().schedule(
+            delay, self._on_transition, next_period, next_boundary
         )
-        self._transition_timer.daemon = True
-        self._transition_timer.start()
         self._debug_log(
-            f"Scheduled next transition for zone '{self._name}' at {next_dt} for period '{next_period.name}' boundary '{next_boundary}'"
+            "Scheduled next transition for zone '%s' at %s for period '%s' boundary '%s'",
+            self._name,
+            next_dt,
+            next_period.name,
+            next_boundary,
         )
 
     def _on_transition(self, period: LightingPeriod, boundary_name: str):
@@ -1639,7 +1985,10 @@ class Zone(AutoLightsBase):
         # 1) process zone so that current_lighting_period has flipped
         #    you need a pointer back to the agent; assume your config holds it:
         self._debug_log(
-            f"Transition triggered for zone '{self._name}': period '{period.name}', boundary '{boundary_name}'"
+            "Transition triggered for zone '%s': period '%s', boundary '%s'",
+            self._name,
+            period.name,
+            boundary_name,
         )
         self._config.agent.process_zone(self)
 
@@ -1655,7 +2004,7 @@ class Zone(AutoLightsBase):
         """
         self._runtime_cache.pop("presence", None)
         if self.enabled and self.extend_lock_when_active and self.has_presence_detected():
-            new_expiration = datetime.datetime.now() + datetime.timedelta(
+            new_expiration = self._now() + datetime.timedelta(
                 minutes=self.lock_extension_duration
             )
             self.lock_expiration = new_expiration
@@ -1668,18 +2017,20 @@ class Zone(AutoLightsBase):
                 f"🔓️Lock expired for zone '{self._name}' and zone is now unlocked"
             )
 
+    @property
+    def tracked_var_ids(self) -> FrozenSet[int]:
+        """
+        Indigo variable ids this zone reacts to (currently its minimum
+        luminance variable); AutoLightsConfig indexes zones by these.
+        """
+        var_id = self._minimum_luminance_var_id
+        return frozenset() if var_id is None else frozenset((var_id,))
+
     def has_variable(self, var_id: int) -> bool:
         """
         Check if the provided variable id is associated with this zone.
-
-        This method determines if the given variable id matches the zone's minimum luminance variable id.
         """
-        if (
-            self._minimum_luminance_var_id is not None
-            and var_id == self._minimum_luminance_var_id
-        ):
-            return True
-        return False
+        return var_id in self.tracked_var_ids
 
     def get_device_states_string(self) -> str:
         """
@@ -1692,14 +2043,11 @@ class Zone(AutoLightsBase):
         # make a single call to current_lights_status so we don’t re-query Indigo every time
         all_status = self.current_lights_status(include_lock_excluded=True)
         status_map = {item["dev_id"]: item["brightness"] for item in all_status}
-        target_map = {
-            item["dev_id"]: item["brightness"]
-            for item in (self.target_brightness or [])
-        }
+        target_map = self._target_brightness_map
 
         for dev_id in self.on_lights_dev_ids + self.off_lights_dev_ids:
             try:
-                dev = indigo.devices[dev_id]
+                dev = self._devices()[dev_id]
             except Exception:
                 # device may have been removed
                 continue
@@ -1707,7 +2055,7 @@ class Zone(AutoLightsBase):
             curr = status_map.get(dev_id, None)
             tgt = target_map.get(dev_id, None)
 
-            light_type = "On Light" if dev_id in self.on_lights_dev_ids else "Off Light"
+            light_type = "On Light" if dev_id in self._on_lights_set else "Off Light"
             excluded = ""
             period = self.current_lighting_period
             if period and self.has_dev_lighting_mapping_exclusion(dev_id, period):
@@ -1727,7 +2075,7 @@ class Zone(AutoLightsBase):
             return False
 
         result = self.has_brightness_changes(exclude_lock_devices=True)
-        self._debug_log(f"has_lock_occurred result: {result}")
+        self._debug_log("has_lock_occurred result: %s", result)
         if self.locked != result:
             self.locked = result
         return result
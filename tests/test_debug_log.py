@@ -0,0 +1,42 @@
+import logging
+
+from auto_lights.auto_lights_base import AutoLightsBase
+
+
+class _Thing(AutoLightsBase):
+    def work(self):
+        self._debug_log("hello")
+
+    def work_with_args(self, value):
+        self._debug_log("value=%s (100%% sure)", value)
+
+
+def _drive(thing):
+    thing.work()
+
+
+def test_debug_log_reports_function_and_caller(caplog):
+    thing = _Thing()
+    with caplog.at_level(logging.DEBUG, logger="Plugin"):
+        _drive(thing)
+    assert len(caplog.records) == 1
+    msg = caplog.records[0].getMessage()
+    assert "[func: work]" in msg
+    assert "[caller: _drive:" in msg
+    assert msg.endswith(" hello")
+
+
+def test_debug_log_skipped_when_debug_disabled(caplog):
+    thing = _Thing()
+    with caplog.at_level(logging.INFO, logger="Plugin"):
+        _drive(thing)
+    assert caplog.records == []
+
+
+def test_debug_log_formats_args(caplog):
+    thing = _Thing()
+    with caplog.at_level(logging.DEBUG, logger="Plugin"):
+        thing.work_with_args(42)
+    msg = caplog.records[0].getMessage()
+    assert "[func: work_with_args]" in msg
+    assert msg.endswith(" value=42 (100% sure)")
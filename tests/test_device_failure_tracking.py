@@ -660,6 +660,81 @@ def test_exception_in_writer_does_not_deadlock(mock_send, agent_and_zone):
     assert zone._pending_writes == 0
 
 
+
+def test_write_pool_shutdown_releases_queued_writes(agent_and_zone, monkeypatch):
+    """Writes cancelled by shutdown_write_executor still check the zone in,
+    and the pool is not recreated afterwards."""
+    import auto_lights.zone as zone_mod
+
+    agent, zone = agent_and_zone
+    monkeypatch.setattr(zone_mod, "MAX_WRITE_WORKERS", 1)
+    monkeypatch.setattr(zone_mod, "_write_executor", None)
+    monkeypatch.setattr(zone_mod, "_write_executor_closed", False)
+
+    make_device(102, brightness=0, onState=False)
+    zone.on_lights_dev_ids = [101, 102]
+    release = threading.Event()
+    started = threading.Event()
+
+    def blocking_send(dev_id, brightness):
+        started.set()
+        release.wait(5.0)
+        return True
+
+    monkeypatch.setattr(utils, "send_to_indigo", blocking_send)
+    monkeypatch.setattr(zone, "_can_reeval", lambda: False)
+    zone.target_brightness = [
+        {"dev_id": 101, "brightness": 100},
+        {"dev_id": 102, "brightness": 100},
+    ]
+    zone.check_out()
+    zone.save_brightness_changes()
+    assert started.wait(5.0)
+
+    # the second write is still queued behind the blocked one
+    zone_mod.shutdown_write_executor()
+    assert zone._pending_writes == 1
+    release.set()
+
+    deadline = time.monotonic() + 5.0
+    while zone.checked_out and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert not zone.checked_out
+    assert zone._pending_writes == 0
+    assert zone_mod._get_write_executor() is None
+
+    # later writes check in without sending instead of reviving the pool
+    make_device(101, brightness=0, onState=False)
+    zone.check_out()
+    zone.save_brightness_changes()
+    assert not zone.checked_out
+    assert zone_mod._write_executor is None
+
+
+
+def test_scheduler_shutdown_is_final(agent_and_zone, monkeypatch):
+    """After shutdown_scheduler, locking a zone (as an in-flight writer's
+    re-evaluation can) gets a no-op timer instead of a new scheduler thread."""
+    import auto_lights.scheduler as scheduler_mod
+
+    agent, zone = agent_and_zone
+    monkeypatch.setattr(scheduler_mod, "_scheduler", None)
+    monkeypatch.setattr(scheduler_mod, "_scheduler_closed", False)
+    scheduler = scheduler_mod.get_scheduler()
+    scheduler_mod.shutdown_scheduler()
+
+    ran = []
+    handle = scheduler_mod.get_scheduler().schedule(0.0, ran.append, "late")
+    assert handle.cancelled
+    assert scheduler_mod.get_scheduler() is scheduler
+    assert scheduler._thread is None
+
+    zone.locked = True
+    assert zone._lock_timer.cancelled
+    assert scheduler._thread is None
+    assert ran == []
+
+
 # --- Re-evaluation rate limit (belt-and-suspenders for runaway loops) ---
 
 
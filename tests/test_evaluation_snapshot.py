@@ -0,0 +1,93 @@
+"""Tests for the per-evaluation state a Zone pins on the calling thread:
+the device snapshot and the pinned clock.
+"""
+
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+from auto_lights.auto_lights_config import AutoLightsConfig
+from tests.helpers import load_yaml, make_device
+
+
+@pytest.fixture
+def zone(tmp_path):
+    data = load_yaml(
+        Path(__file__).parent / "configs" / "scenario1_presence_dark_adjust_false.yaml"
+    )
+    config_json = {
+        "plugin_config": data.get("plugin_config", {}),
+        "lighting_periods": data.get("lighting_periods", []),
+        "zones": data.get("zones", []),
+    }
+    conf_path = tmp_path / "conf.json"
+    conf_path.write_text(json.dumps(config_json))
+    cfg = AutoLightsConfig(str(conf_path))
+    return cfg.zones[0]
+
+
+def test_device_snapshot_reuses_devices_for_one_evaluation(zone):
+    dev_id = zone.on_lights_dev_ids[0]
+    make_device(dev_id, brightness=20)
+    assert zone.begin_evaluation() is True
+    try:
+        assert zone.current_lights_status()[0]["brightness"] == 20
+        # the evaluation keeps the device it already fetched
+        make_device(dev_id, brightness=60)
+        assert zone.current_lights_status()[0]["brightness"] == 20
+        # a nested evaluation on this thread keeps the outer snapshot
+        assert zone.begin_evaluation() is False
+        assert zone.current_lights_status()[0]["brightness"] == 20
+    finally:
+        zone.end_evaluation()
+    assert zone.current_lights_status()[0]["brightness"] == 60
+
+
+def test_device_kind_reads_the_evaluation_snapshot(zone):
+    dev_id = zone.on_lights_dev_ids[0]
+    make_device(dev_id, brightness=20)
+    zone._dev_kinds.pop(dev_id, None)
+    zone.begin_evaluation()
+    try:
+        zone._device_kind(dev_id)
+        # the light is now in the snapshot, so the plan will not fetch it again
+        assert dev_id in zone._eval_local.dev_snapshot
+    finally:
+        zone.end_evaluation()
+
+
+def test_device_snapshot_is_not_shared_across_threads(zone):
+    dev_id = zone.on_lights_dev_ids[0]
+    make_device(dev_id, brightness=20)
+    zone.begin_evaluation()
+    try:
+        zone.current_lights_status()
+        make_device(dev_id, brightness=60)
+        seen = []
+        t = threading.Thread(
+            target=lambda: seen.append(zone.current_lights_status()[0]["brightness"])
+        )
+        t.start()
+        t.join()
+        # another thread reads live devices, not this evaluation's snapshot
+        assert seen == [60]
+    finally:
+        zone.end_evaluation()
+
+
+def test_pinned_now_is_per_thread(zone):
+    zone.begin_evaluation()
+    try:
+        pinned = zone._now()
+        assert zone._now() == pinned
+        seen = []
+        t = threading.Thread(target=lambda: seen.append(zone._now()))
+        t.start()
+        t.join()
+        # another thread reads the live clock, not this evaluation's pin
+        assert seen[0] is not pinned
+    finally:
+        zone.end_evaluation()
+    assert zone._now() is not pinned
@@ -0,0 +1,130 @@
+"""Tests for syncing a Zone to its Indigo plugin device: the device lookup,
+when a sync runs, and which states are built and pushed.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from auto_lights.auto_lights_config import AutoLightsConfig
+from tests.helpers import load_yaml, make_device
+
+
+@pytest.fixture
+def zone(tmp_path):
+    data = load_yaml(
+        Path(__file__).parent / "configs" / "scenario1_presence_dark_adjust_false.yaml"
+    )
+    config_json = {
+        "plugin_config": data.get("plugin_config", {}),
+        "lighting_periods": data.get("lighting_periods", []),
+        "zones": data.get("zones", []),
+    }
+    conf_path = tmp_path / "conf.json"
+    conf_path.write_text(json.dumps(config_json))
+    cfg = AutoLightsConfig(str(conf_path))
+    return cfg.zones[0]
+
+
+def test_indigo_dev_lookup_is_shared_across_zone_objects(zone, monkeypatch):
+    import auto_lights.zone as zone_mod
+
+    monkeypatch.setattr(zone_mod, "_ZONE_INDIGO_DEV_IDS", {})
+    zone.zone_index = "zone-under-test"
+    zone._indigo_dev_id = None
+    dev = make_device(7001)
+    dev.pluginId = "com.vtmikel.autolights"
+    dev.deviceTypeId = "auto_lights_zone"
+    dev.pluginProps = {"zone_index": "zone-under-test"}
+
+    assert zone.indigo_dev is dev
+    assert zone_mod._ZONE_INDIGO_DEV_IDS == {"zone-under-test": 7001}
+
+    # a rebuilt zone resolves the cached id; a stale entry falls back to a scan
+    zone._indigo_dev_id = None
+    assert zone.indigo_dev is dev
+    zone._indigo_dev_id = None
+    zone_mod._ZONE_INDIGO_DEV_IDS["zone-under-test"] = 424242
+    assert zone.indigo_dev is dev
+
+
+def test_from_config_dict_syncs_once(zone, monkeypatch):
+    import auto_lights.zone as zone_mod
+
+    calls = []
+    monkeypatch.setattr(zone_mod.Zone, "sync_indigo_device", lambda self: calls.append(1))
+    zone.from_config_dict(
+        {
+            "device_settings": {"on_lights_dev_ids": [11], "off_lights_dev_ids": [12]},
+            "minimum_luminance_settings": {"minimum_luminance": 70},
+            "behavior_settings": {"lock_duration": 9, "off_lights_behavior": ""},
+        }
+    )
+    assert len(calls) == 1
+    assert zone.on_lights_dev_ids == [11]
+    assert zone.minimum_luminance == 70
+
+
+def test_schema_states_reencode_changed_lists(zone):
+    dev = make_device(7100)
+    dev.states["on_lights_dev_ids"] = ""
+    zone.on_lights_dev_ids = [1, 2]
+    first = {s["key"]: s["value"] for s in zone._build_schema_states(dev)}
+    assert first["on_lights_dev_ids"] == "[1, 2]"
+
+    zone.on_lights_dev_ids = [1, 2, 3]
+    second = {s["key"]: s["value"] for s in zone._build_schema_states(dev)}
+    assert second["on_lights_dev_ids"] == "[1, 2, 3]"
+
+
+def test_setattr_syncs_only_config_state_attributes(zone, monkeypatch):
+    import auto_lights.zone as zone_mod
+
+    calls = []
+    monkeypatch.setattr(zone_mod.Zone, "sync_indigo_device", lambda self: calls.append(1))
+    zone.zone_index = "zone-under-test"
+    zone._luminance = 12
+    zone._runtime_cache = {}
+    assert calls == []
+
+    zone._lock_duration = 15
+    assert len(calls) == 1
+
+
+def test_sync_pushes_only_changed_states(zone):
+    dev = make_device(7200)
+    dev.states.update({"zone_locked": True, "luminance": -1})
+    pushed = []
+    dev.updateStatesOnServer = lambda states: pushed.append(
+        {s["key"]: s["value"] for s in states}
+    )
+    zone._indigo_dev_id = 7200
+    zone._zone_index = None
+
+    zone.sync_indigo_device()
+    assert len(pushed) == 1
+    for key, value in pushed[0].items():
+        dev.states[key] = value
+
+    zone._runtime_cache.clear()
+    zone.sync_indigo_device()
+    assert len(pushed) == 1
+
+
+def test_current_period_runtime_states(zone):
+    import datetime
+
+    from auto_lights.lighting_period import LightingPeriod
+
+    zone.lighting_periods = []
+    assert zone._get_runtime_state_value("current_period_name") == ""
+    assert zone._get_runtime_state_value("current_period_from") == ""
+
+    zone.lighting_periods = [
+        LightingPeriod("All Day", "On and Off", datetime.time(0), datetime.time(23, 59, 59))
+    ]
+    assert zone._get_runtime_state_value("current_period_name") == "All Day"
+    assert zone._get_runtime_state_value("current_period_mode") == "On and Off"
+    assert zone._get_runtime_state_value("current_period_from") == "00:00"
+    assert zone._get_runtime_state_value("current_period_to") == "23:59"
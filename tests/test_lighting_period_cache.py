@@ -0,0 +1,71 @@
+"""Tests for the Zone's cached lighting-period lookups: the current period
+and its boundary window, and per-device period exclusions.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from auto_lights.auto_lights_config import AutoLightsConfig
+from tests.helpers import load_yaml
+
+
+@pytest.fixture
+def zone(tmp_path):
+    data = load_yaml(
+        Path(__file__).parent / "configs" / "scenario1_presence_dark_adjust_false.yaml"
+    )
+    config_json = {
+        "plugin_config": data.get("plugin_config", {}),
+        "lighting_periods": data.get("lighting_periods", []),
+        "zones": data.get("zones", []),
+    }
+    conf_path = tmp_path / "conf.json"
+    conf_path.write_text(json.dumps(config_json))
+    cfg = AutoLightsConfig(str(conf_path))
+    return cfg.zones[0]
+
+
+def test_current_lighting_period_follows_boundaries(zone, monkeypatch):
+    import datetime
+
+    import auto_lights.zone as zone_mod
+    from auto_lights.lighting_period import LightingPeriod
+
+    clock = {"now": datetime.datetime(2020, 1, 1, 8, 0, 0)}
+
+    class Clock(datetime.datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return clock["now"]
+
+    monkeypatch.setattr(zone_mod.datetime, "datetime", Clock)
+    morning = LightingPeriod("Morning", "On and Off", datetime.time(6), datetime.time(9))
+    evening = LightingPeriod("Evening", "On and Off", datetime.time(18), datetime.time(23))
+    zone.lighting_periods = [morning, evening]
+
+    assert zone.current_lighting_period is morning
+    clock["now"] = datetime.datetime(2020, 1, 1, 9, 0, 0)
+    assert zone.current_lighting_period is morning
+    clock["now"] = datetime.datetime(2020, 1, 1, 9, 0, 1)
+    assert zone.current_lighting_period is None
+    clock["now"] = datetime.datetime(2020, 1, 1, 18, 0, 0)
+    assert zone.current_lighting_period is evening
+    # moving the clock backwards also re-evaluates
+    clock["now"] = datetime.datetime(2020, 1, 1, 7, 0, 0)
+    assert zone.current_lighting_period is morning
+
+
+def test_device_period_exclusions_use_int_keys(zone):
+    import datetime
+
+    from auto_lights.lighting_period import LightingPeriod
+
+    period = LightingPeriod("Night", "On and Off", datetime.time(0), datetime.time(6))
+    period.id = 3
+    zone.device_period_map = {"101": {"3": False}, "102": {"3": True}}
+    assert zone.has_dev_lighting_mapping_exclusion(101, period) is True
+    assert zone.has_dev_lighting_mapping_exclusion(102, period) is False
+    # devices missing from the map stay under the period's control
+    assert zone.has_dev_lighting_mapping_exclusion(103, period) is False
@@ -0,0 +1,40 @@
+import threading
+
+from auto_lights.scheduler import Scheduler
+
+
+def test_callbacks_run_in_deadline_order():
+    scheduler = Scheduler()
+    ran = []
+    done = threading.Event()
+    scheduler.schedule(0.10, lambda: (ran.append("late"), done.set()))
+    scheduler.schedule(0.02, ran.append, "early")
+    scheduler.schedule(0.05, ran.append, "middle")
+    assert done.wait(2.0)
+    assert ran == ["early", "middle", "late"]
+    scheduler.shutdown()
+
+
+def test_cancelled_callback_does_not_run():
+    scheduler = Scheduler()
+    ran = []
+    done = threading.Event()
+    handle = scheduler.schedule(0.02, ran.append, "cancelled")
+    scheduler.schedule(0.05, done.set)
+    handle.cancel()
+    assert done.wait(2.0)
+    assert ran == []
+    scheduler.shutdown()
+
+
+def test_failing_callback_does_not_stop_scheduler():
+    scheduler = Scheduler()
+    done = threading.Event()
+
+    def boom():
+        raise RuntimeError("callback failed")
+
+    scheduler.schedule(0.0, boom)
+    scheduler.schedule(0.02, done.set)
+    assert done.wait(2.0)
+    scheduler.shutdown()
@@ -79,3 +79,27 @@ def test_no_unlock_when_stale_cache_hides_presence(config):
     agent._unlock_after_grace(zone)
     # Zone should stay locked because fresh device read shows presence
     assert zone.locked
+
+
+def test_grace_timer_uses_shared_scheduler(config, monkeypatch):
+    import auto_lights.scheduler as scheduler_mod
+    import auto_lights.zone as zone_mod
+    from auto_lights.scheduler import TimerHandle
+
+    # agent.shutdown() closes the write pool and scheduler for good; give
+    # this test its own scheduler and reopen both for later tests
+    monkeypatch.setattr(zone_mod, "_write_executor_closed", False)
+    monkeypatch.setattr(scheduler_mod, "_scheduler", None)
+    monkeypatch.setattr(scheduler_mod, "_scheduler_closed", False)
+
+    cfg = config("scenario1_presence_dark_adjust_false.yaml")
+    agent = AutoLightsAgent(cfg)
+    zone = cfg.zones[0]
+    zone.unlock_when_no_presence = True
+    zone.locked = True
+    handle = agent._no_presence_timers[zone.name]
+    assert isinstance(handle, TimerHandle)
+
+    agent.shutdown()
+    assert handle.cancelled
+    assert agent._no_presence_timers == {}
@@ -1,5 +1,8 @@
 import json
 import datetime
+import types
+
+import indigo
 import pytest
 from auto_lights.auto_lights_config import AutoLightsConfig
 from auto_lights.auto_lights_agent import AutoLightsAgent
@@ -69,3 +72,16 @@ def test_locked_zone(load_scenario):
     zone.locked = True
     result = cfg.agent.process_zone(zone)
     assert result is False
+
+def test_bad_global_behavior_entry_is_skipped(load_scenario):
+    # Scenario: one malformed global entry must not stop the other globals
+    data, cfg = load_scenario("tests/configs/scenario10_global_off.yaml")
+    zone = cfg.zones[0]
+    expected = cfg.has_global_lights_off(zone).contributions
+    # a variable whose value can't be read
+    indigo.variables[902] = types.SimpleNamespace(id=902)
+    cfg.global_behavior_variables = [
+        {"comparison_type": "is TRUE (bool)", "var_value": ""},
+        {"var_id": 902, "comparison_type": "is TRUE (bool)", "var_value": ""},
+    ] + cfg.global_behavior_variables
+    assert cfg.has_global_lights_off(zone).contributions == expected
@@ -0,0 +1,109 @@
+"""Tests for the Zone's small state-summary helpers and the device-list
+lookups they build on.
+
+Target and status entries mix int brightness (dimmers) and bool on/off
+(relays); the helpers must treat ``True``/non-zero as on and
+``False``/``0`` as off for both shapes.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from auto_lights.auto_lights_config import AutoLightsConfig
+from tests.helpers import load_yaml, make_device
+
+
+@pytest.fixture
+def zone(tmp_path):
+    data = load_yaml(
+        Path(__file__).parent / "configs" / "scenario1_presence_dark_adjust_false.yaml"
+    )
+    config_json = {
+        "plugin_config": data.get("plugin_config", {}),
+        "lighting_periods": data.get("lighting_periods", []),
+        "zones": data.get("zones", []),
+    }
+    conf_path = tmp_path / "conf.json"
+    conf_path.write_text(json.dumps(config_json))
+    cfg = AutoLightsConfig(str(conf_path))
+    return cfg.zones[0]
+
+
+def test_target_brightness_all_off_mixed_types(zone):
+    make_device(1, brightness=0)
+    make_device(2, device_cls="relay")
+    zone.target_brightness = [
+        {"dev_id": 1, "brightness": 0},
+        {"dev_id": 2, "brightness": False},
+    ]
+    assert zone.target_brightness_all_off is True
+
+    zone.target_brightness = [
+        {"dev_id": 1, "brightness": 0},
+        {"dev_id": 2, "brightness": True},
+    ]
+    assert zone.target_brightness_all_off is False
+
+    zone.target_brightness = [{"dev_id": 1, "brightness": 40}]
+    assert zone.target_brightness_all_off is False
+
+
+def test_target_brightness_map_follows_setter(zone):
+    make_device(1, brightness=0)
+    make_device(2, device_cls="relay")
+    zone.target_brightness = [
+        {"dev_id": 1, "brightness": 140},
+        {"dev_id": 2, "brightness": 1},
+    ]
+    assert zone.target_brightness_map == {1: 100, 2: True}
+
+    zone.on_lights_dev_ids = zone.on_lights_dev_ids + [9999]
+    assert zone.target_brightness_map == {}
+
+
+def test_target_brightness_all_off_empty(zone):
+    zone.target_brightness = []
+    assert zone.target_brightness_all_off is False
+
+
+def test_current_state_any_light_is_on(zone):
+    dev_id = zone.on_lights_dev_ids[0]
+    make_device(dev_id, brightness=0)
+    assert zone._current_state_any_light_is_on() is False
+
+    make_device(dev_id, brightness=35)
+    assert zone._current_state_any_light_is_on() is True
+
+
+def test_changing_light_lists_discards_target(zone):
+    zone._target_brightness = [{"dev_id": 1, "brightness": 40}]
+    zone.on_lights_dev_ids = list(zone.on_lights_dev_ids)
+    assert zone.target_brightness is not None
+
+    zone.on_lights_dev_ids = zone.on_lights_dev_ids + [9999]
+    assert zone.target_brightness is None
+
+
+def test_has_device_reverse_index(zone):
+    on_id = zone.on_lights_dev_ids[0]
+    presence_id = zone.presence_dev_ids[0]
+    assert zone._has_device(on_id) == "on_lights_dev_ids"
+    assert zone._has_device(presence_id) == "presence_dev_ids"
+    assert zone._has_device(424242) == ""
+
+    # exclude_from_lock takes precedence, as with the original list checks
+    zone.exclude_from_lock_dev_ids = [on_id]
+    assert zone._has_device(on_id) == "exclude_from_lock_dev_ids"
+    zone.exclude_from_lock_dev_ids = []
+    assert zone._has_device(on_id) == "on_lights_dev_ids"
+
+
+def test_current_lights_status_skips_lock_excluded(zone):
+    on_id = zone.on_lights_dev_ids[0]
+    zone.exclude_from_lock_dev_ids = [on_id]
+    ids = [s["dev_id"] for s in zone.current_lights_status()]
+    assert on_id not in ids
+    ids = [s["dev_id"] for s in zone.current_lights_status(include_lock_excluded=True)]
+    assert ids[0] == on_id
@@ -0,0 +1,57 @@
+"""Tests for a Zone's Indigo variables: the cached minimum-luminance value
+and the config's variable -> zones index.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from auto_lights.auto_lights_config import AutoLightsConfig
+from tests.helpers import load_yaml
+
+
+@pytest.fixture
+def zone(tmp_path):
+    data = load_yaml(
+        Path(__file__).parent / "configs" / "scenario1_presence_dark_adjust_false.yaml"
+    )
+    config_json = {
+        "plugin_config": data.get("plugin_config", {}),
+        "lighting_periods": data.get("lighting_periods", []),
+        "zones": data.get("zones", []),
+    }
+    conf_path = tmp_path / "conf.json"
+    conf_path.write_text(json.dumps(config_json))
+    cfg = AutoLightsConfig(str(conf_path))
+    return cfg.zones[0]
+
+
+def test_minimum_luminance_variable_is_cached_until_invalidated(zone):
+    import indigo
+
+    indigo.variables[5501] = indigo.Variable(5501, name="threshold", value="40")
+    zone.minimum_luminance_var_id = 5501
+    assert zone.minimum_luminance == 40.0
+
+    indigo.variables[5501].value = "75"
+    assert zone.minimum_luminance == 40.0
+    zone.invalidate_minimum_luminance()
+    assert zone.minimum_luminance == 75.0
+
+
+def test_zones_for_variable_follows_zone_variable(zone):
+    import indigo
+
+    config = zone._config
+    indigo.variables[5502] = indigo.Variable(5502, name="threshold", value="40")
+    zone.minimum_luminance_var_id = 5502
+    assert zone.has_variable(5502)
+    assert config.zones_for_variable(5502) == [zone]
+
+    # turning the variable off in config goes through the same setter
+    zone.from_config_dict(
+        {"minimum_luminance_settings": {"minimum_luminance_use_variable": False}}
+    )
+    assert not zone.has_variable(5502)
+    assert config.zones_for_variable(5502) == []